@@ -6,6 +6,7 @@
 //! - `--security` - security vulnerability scanning
 //! - (no flags) - run all analyses
 
+use std::cmp::Ordering;
 use std::collections::HashMap;
 use std::path::Path;
 use std::process::Command;
@@ -154,10 +155,11 @@ impl AnalyzeReport {
         if let Some(ref complexity) = self.complexity {
             sections.push("# Complexity Analysis".to_string());
             sections.push(String::new());
+            let totals = complexity.totals();
             sections.push(format!("Functions: {}", complexity.functions.len()));
-            sections.push(format!("Average: {:.1}", complexity.avg_complexity()));
-            sections.push(format!("Maximum: {}", complexity.max_complexity()));
-            sections.push(format!("High risk (>10): {}", complexity.high_risk_count()));
+            sections.push(format!("Average: {:.1}", totals.avg_complexity));
+            sections.push(format!("Maximum: {}", totals.max_complexity));
+            sections.push(format!("High risk (>10): {}", totals.high_risk_count));
 
             if !complexity.functions.is_empty() {
                 sections.push(String::new());
@@ -248,14 +250,15 @@ impl AnalyzeReport {
                 })
                 .collect();
 
+            let totals = complexity.totals();
             obj.insert(
                 "complexity".to_string(),
                 serde_json::json!({
                     "file": complexity.file_path,
                     "functions": functions,
-                    "avg_complexity": complexity.avg_complexity(),
-                    "max_complexity": complexity.max_complexity(),
-                    "high_risk_count": complexity.high_risk_count(),
+                    "avg_complexity": totals.avg_complexity,
+                    "max_complexity": totals.max_complexity,
+                    "high_risk_count": totals.high_risk_count,
                 }),
             );
         }
@@ -463,6 +466,22 @@ pub fn analyze_codebase_complexity(
         all_functions
     };
 
+    // Drop everything below the Nth highest complexity first, so only the
+    // top N get sorted. Ties at the cutoff keep their collection order.
+    if limit > 0 && filtered.len() > limit {
+        let mut complexities: Vec<usize> = filtered.iter().map(|f| f.complexity).collect();
+        let (_, &mut cutoff, _) = complexities.select_nth_unstable_by(limit - 1, |a, b| b.cmp(a));
+        let mut ties = limit - filtered.iter().filter(|f| f.complexity > cutoff).count();
+        filtered.retain(|f| match f.complexity.cmp(&cutoff) {
+            Ordering::Greater => true,
+            Ordering::Equal if ties > 0 => {
+                ties -= 1;
+                true
+            }
+            _ => false,
+        });
+    }
+
     // Sort by complexity descending and take top N
     filtered.sort_by(|a, b| b.complexity.cmp(&a.complexity));
     filtered.truncate(limit);
@@ -517,103 +536,113 @@ pub fn analyze(
     // Track skipped analyses for user feedback
     let skipped = Vec::new();
 
-    let health = if run_health && !is_file && !has_symbol_target {
-        // Health is codebase-wide, skip if targeting a symbol
-        let analysis_root = if let Some(ref fp) = file_path {
-            root.join(fp)
-        } else {
-            root.to_path_buf()
-        };
-        if analysis_root.is_dir() {
-            Some(analyze_health(&analysis_root))
-        } else {
-            None
-        }
-    } else {
-        None
-    };
-
-    let complexity = if run_complexity {
-        if !is_file {
-            // Codebase-wide complexity: show top 10 most complex functions
+    // The passes are independent walks of the tree, so they run side by side
+    let health_pass = || {
+        if run_health && !is_file && !has_symbol_target {
+            // Health is codebase-wide, skip if targeting a symbol
             let analysis_root = if let Some(ref fp) = file_path {
                 root.join(fp)
             } else {
                 root.to_path_buf()
             };
             if analysis_root.is_dir() {
-                Some(analyze_codebase_complexity(
-                    &analysis_root,
-                    10,
-                    complexity_threshold,
-                    filter,
-                ))
+                Some(analyze_health(&analysis_root))
             } else {
                 None
             }
-        } else if let Some(ref fp) = file_path {
-            let full_path = root.join(fp);
-            let mut report = analyze_file_complexity(&full_path);
-
-            // Apply symbol filter if targeting a specific symbol
-            if let Some(ref mut r) = report {
-                if has_symbol_target {
-                    let target_name = symbol_path.last().unwrap();
-                    let target_parent = if symbol_path.len() > 1 {
-                        Some(symbol_path[symbol_path.len() - 2].as_str())
-                    } else {
-                        None
-                    };
+        } else {
+            None
+        }
+    };
 
-                    r.functions.retain(|f| {
-                        // Match by name
-                        if f.name != *target_name {
-                            return false;
-                        }
-                        // If parent specified in path, match that too
-                        if let Some(tp) = target_parent {
-                            f.parent.as_ref().map(|p| p == tp).unwrap_or(false)
+    let complexity_pass = || {
+        if run_complexity {
+            if !is_file {
+                // Codebase-wide complexity: show top 10 most complex functions
+                let analysis_root = if let Some(ref fp) = file_path {
+                    root.join(fp)
+                } else {
+                    root.to_path_buf()
+                };
+                if analysis_root.is_dir() {
+                    Some(analyze_codebase_complexity(
+                        &analysis_root,
+                        10,
+                        complexity_threshold,
+                        filter,
+                    ))
+                } else {
+                    None
+                }
+            } else if let Some(ref fp) = file_path {
+                let full_path = root.join(fp);
+                let mut report = analyze_file_complexity(&full_path);
+
+                // Apply symbol filter if targeting a specific symbol
+                if let Some(ref mut r) = report {
+                    if has_symbol_target {
+                        let target_name = symbol_path.last().unwrap();
+                        let target_parent = if symbol_path.len() > 1 {
+                            Some(symbol_path[symbol_path.len() - 2].as_str())
                         } else {
-                            true
-                        }
-                    });
+                            None
+                        };
+
+                        r.functions.retain(|f| {
+                            // Match by name
+                            if f.name != *target_name {
+                                return false;
+                            }
+                            // If parent specified in path, match that too
+                            if let Some(tp) = target_parent {
+                                f.parent.as_ref().map(|p| p == tp).unwrap_or(false)
+                            } else {
+                                true
+                            }
+                        });
+                    }
                 }
-            }
 
-            // Apply threshold filter
-            if let (Some(ref mut r), Some(threshold)) = (&mut report, complexity_threshold) {
-                r.functions.retain(|f| f.complexity >= threshold);
-            }
+                // Apply threshold filter
+                if let (Some(ref mut r), Some(threshold)) = (&mut report, complexity_threshold) {
+                    r.functions.retain(|f| f.complexity >= threshold);
+                }
 
-            // Apply kind filter (function = no parent, method = has parent)
-            if let (Some(ref mut r), Some(k)) = (&mut report, &kind) {
-                match *k {
-                    "function" => r.functions.retain(|f| f.parent.is_none()),
-                    "method" => r.functions.retain(|f| f.parent.is_some()),
-                    _ => {} // Unknown kind, don't filter
+                // Apply kind filter (function = no parent, method = has parent)
+                if let (Some(ref mut r), Some(k)) = (&mut report, &kind) {
+                    match *k {
+                        "function" => r.functions.retain(|f| f.parent.is_none()),
+                        "method" => r.functions.retain(|f| f.parent.is_some()),
+                        _ => {} // Unknown kind, don't filter
+                    }
                 }
-            }
 
-            report
+                report
+            } else {
+                None
+            }
         } else {
             None
         }
-    } else {
-        None
     };
 
-    let security = if run_security && !has_symbol_target {
-        // Security doesn't apply to single symbols
-        let analysis_root = if let Some(ref fp) = file_path {
-            root.join(fp)
+    let security_pass = || {
+        if run_security && !has_symbol_target {
+            // Security doesn't apply to single symbols
+            let analysis_root = if let Some(ref fp) = file_path {
+                root.join(fp)
+            } else {
+                root.to_path_buf()
+            };
+            Some(analyze_security(&analysis_root))
         } else {
-            root.to_path_buf()
-        };
-        Some(analyze_security(&analysis_root))
-    } else {
-        None
+            None
+        }
     };
 
+    let (health, (complexity, security)) =
+        rayon::join(health_pass, || rayon::join(complexity_pass, security_pass));
+
     AnalyzeReport {
         health,
         complexity,
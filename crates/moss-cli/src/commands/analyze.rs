@@ -9,6 +9,7 @@ use crate::index;
 use crate::overview;
 use crate::path_resolve;
 use moss_tools::registry_with_custom;
+use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
 
 /// Run analysis on a target (file or directory)
@@ -565,46 +566,65 @@ fn cmd_hotspots(root: &Path, json: bool) -> i32 {
         return 1;
     }
 
-    // Get file commit counts and churn from git log
-    let output = match std::process::Command::new("git")
+    // Get file commit counts and churn from git log. Full-history numstat
+    // output can be large, so it is read line by line rather than buffered.
+    let mut child = match std::process::Command::new("git")
         .args(["log", "--format=", "--numstat"])
         .current_dir(root)
-        .output()
+        .stdout(std::process::Stdio::piped())
+        .stderr(std::process::Stdio::null())
+        .spawn()
     {
-        Ok(o) => o,
+        Ok(c) => c,
         Err(e) => {
             eprintln!("Failed to run git log: {}", e);
             return 1;
         }
     };
 
-    if !output.status.success() {
-        eprintln!("git log failed");
-        return 1;
-    }
-
     // Parse numstat output: added<TAB>deleted<TAB>path
-    let stdout = String::from_utf8_lossy(&output.stdout);
     let mut file_stats: std::collections::HashMap<String, (usize, usize, usize)> =
         std::collections::HashMap::new();
 
-    for line in stdout.lines() {
-        let parts: Vec<&str> = line.split('\t').collect();
-        if parts.len() == 3 {
-            let added = parts[0].parse::<usize>().unwrap_or(0);
-            let deleted = parts[1].parse::<usize>().unwrap_or(0);
-            let path = parts[2].to_string();
-
-            // Skip binary files (shown as -)
-            if parts[0] == "-" || parts[1] == "-" {
-                continue;
+    let mut read_failed = false;
+    if let Some(stdout) = child.stdout.take() {
+        let mut reader = BufReader::new(stdout);
+        let mut buf = Vec::new();
+        loop {
+            match reader.read_until(b'\n', &mut buf) {
+                Ok(0) => break,
+                Ok(_) => {}
+                Err(_) => {
+                    read_failed = true;
+                    break;
+                }
             }
-
-            let entry = file_stats.entry(path).or_insert((0, 0, 0));
-            entry.0 += 1; // commits
-            entry.1 += added;
-            entry.2 += deleted;
+            let line = String::from_utf8_lossy(&buf);
+            let parts: Vec<&str> = line.trim_end_matches('\n').split('\t').collect();
+            if parts.len() == 3 {
+                let added = parts[0].parse::<usize>().unwrap_or(0);
+                let deleted = parts[1].parse::<usize>().unwrap_or(0);
+
+                // Skip binary files (shown as -)
+                if parts[0] != "-" && parts[1] != "-" {
+                    let entry = file_stats.entry(parts[2].to_string()).or_insert((0, 0, 0));
+                    entry.0 += 1; // commits
+                    entry.1 += added;
+                    entry.2 += deleted;
+                }
+            }
+            buf.clear();
         }
+        // Close our end of the pipe before waiting, so git can't block writing to it
+        drop(reader);
+    }
+
+    if read_failed {
+        let _ = child.kill();
+    }
+    if !child.wait().is_ok_and(|status| status.success()) || read_failed {
+        eprintln!("git log failed");
+        return 1;
     }
 
     // Get complexity from index
@@ -615,9 +635,9 @@ fn cmd_hotspots(root: &Path, json: bool) -> i32 {
             let mut hotspots: Vec<FileHotspot> = file_stats
                 .into_iter()
                 .filter(|(path, _)| {
-                    // Filter to source files only
+                    // Filter to source files only (extension check first, it needs no stat)
                     let p = Path::new(path);
-                    p.exists() && is_source_file(p)
+                    is_source_file(p) && p.exists()
                 })
                 .map(|(path, (commits, added, deleted))| {
                     let churn = added + deleted;
@@ -645,7 +665,7 @@ fn cmd_hotspots(root: &Path, json: bool) -> i32 {
 
     for (path, (commits, added, deleted)) in file_stats {
         let p = Path::new(&path);
-        if !p.exists() || !is_source_file(p) {
+        if !is_source_file(p) || !p.exists() {
             continue;
         }
 
@@ -794,17 +814,12 @@ fn cmd_check_refs(root: &Path, json: bool) -> i32 {
         return 1;
     }
 
-    // Find markdown files
+    // Find markdown files, pruning hidden directories instead of walking them
     let md_files: Vec<_> = walkdir::WalkDir::new(root)
         .into_iter()
+        .filter_entry(|e| e.depth() == 0 || !e.file_name().to_string_lossy().starts_with('.'))
         .filter_map(|e| e.ok())
-        .filter(|e| {
-            e.path().extension().and_then(|s| s.to_str()) == Some("md")
-                && !e
-                    .path()
-                    .components()
-                    .any(|c| c.as_os_str().to_string_lossy().starts_with('.'))
-        })
+        .filter(|e| e.path().extension().and_then(|s| s.to_str()) == Some("md"))
         .map(|e| e.path().to_path_buf())
         .collect();
 
@@ -78,11 +78,40 @@ fn cmd_filter_aliases(root: &Path, json: bool) -> i32 {
     0
 }
 
+/// File extensions and the language each one indicates.
+const LANGUAGE_EXTENSIONS: &[(&str, &str)] = &[
+    ("go", "go"),
+    ("py", "python"),
+    ("pyi", "python"),
+    ("rs", "rust"),
+    ("js", "javascript"),
+    ("mjs", "javascript"),
+    ("cjs", "javascript"),
+    ("ts", "typescript"),
+    ("mts", "typescript"),
+    ("cts", "typescript"),
+    ("java", "java"),
+    ("rb", "ruby"),
+    ("c", "c"),
+    ("h", "c"),
+    ("cpp", "cpp"),
+    ("cc", "cpp"),
+    ("cxx", "cpp"),
+    ("hpp", "cpp"),
+];
+
 /// Detect programming languages in the project.
 pub fn detect_project_languages(root: &Path) -> Vec<String> {
-    use std::collections::HashSet;
+    use std::collections::BTreeSet;
+
+    // Number of distinct languages the table can report
+    let known_languages = LANGUAGE_EXTENSIONS
+        .iter()
+        .map(|(_, lang)| lang)
+        .collect::<BTreeSet<_>>()
+        .len();
 
-    let mut languages = HashSet::new();
+    let mut languages = BTreeSet::new();
 
     // Walk the project directory (limited depth for performance)
     let walker = ignore::WalkBuilder::new(root)
@@ -92,42 +121,20 @@ pub fn detect_project_languages(root: &Path) -> Vec<String> {
         .build();
 
     for entry in walker.flatten() {
-        let path = entry.path();
-        if let Some(ext) = path.extension().and_then(|e| e.to_str()) {
-            match ext {
-                "go" => {
-                    languages.insert("go".to_string());
-                }
-                "py" | "pyi" => {
-                    languages.insert("python".to_string());
-                }
-                "rs" => {
-                    languages.insert("rust".to_string());
-                }
-                "js" | "mjs" | "cjs" => {
-                    languages.insert("javascript".to_string());
-                }
-                "ts" | "mts" | "cts" => {
-                    languages.insert("typescript".to_string());
-                }
-                "java" => {
-                    languages.insert("java".to_string());
-                }
-                "rb" => {
-                    languages.insert("ruby".to_string());
-                }
-                "c" | "h" => {
-                    languages.insert("c".to_string());
-                }
-                "cpp" | "cc" | "cxx" | "hpp" => {
-                    languages.insert("cpp".to_string());
-                }
-                _ => {}
-            }
+        let Some(ext) = entry.path().extension().and_then(|e| e.to_str()) else {
+            continue;
+        };
+        let Some(&(_, language)) = LANGUAGE_EXTENSIONS.iter().find(|(e, _)| *e == ext) else {
+            continue;
+        };
+        languages.insert(language);
+
+        // Nothing left to find; don't walk the rest of the tree
+        if languages.len() == known_languages {
+            break;
         }
     }
 
-    let mut result: Vec<_> = languages.into_iter().collect();
-    result.sort();
-    result
+    // BTreeSet iterates in sorted order
+    languages.into_iter().map(String::from).collect()
 }
@@ -1,6 +1,6 @@
 //! Sessions command - analyze Claude Code and other agent session logs.
 
-use crate::sessions::analyze_session;
+use crate::sessions::{analyze_session, LOG_READ_BUFFER_SIZE};
 use std::fs::File;
 use std::io::{BufRead, BufReader, Write};
 use std::path::{Path, PathBuf};
@@ -14,21 +14,26 @@ pub fn cmd_sessions_list(project: Option<&Path>, limit: usize, json: bool) -> i3
         return 1;
     };
 
-    if !dir.exists() {
-        eprintln!("Sessions directory not found: {}", dir.display());
-        return 1;
-    }
+    let entries = match std::fs::read_dir(&dir) {
+        Ok(entries) => entries,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+            eprintln!("Sessions directory not found: {}", dir.display());
+            return 1;
+        }
+        Err(e) => {
+            eprintln!("Failed to read {}: {}", dir.display(), e);
+            return 1;
+        }
+    };
 
     // Find all .jsonl files, sorted by modification time (newest first)
     let mut sessions: Vec<(PathBuf, std::time::SystemTime)> = Vec::new();
-    if let Ok(entries) = std::fs::read_dir(&dir) {
-        for entry in entries.filter_map(|e| e.ok()) {
-            let path = entry.path();
-            if path.extension().and_then(|e| e.to_str()) == Some("jsonl") {
-                if let Ok(meta) = path.metadata() {
-                    if let Ok(mtime) = meta.modified() {
-                        sessions.push((path, mtime));
-                    }
+    for entry in entries.filter_map(|e| e.ok()) {
+        let path = entry.path();
+        if path.extension().and_then(|e| e.to_str()) == Some("jsonl") {
+            if let Ok(meta) = path.metadata() {
+                if let Ok(mtime) = meta.modified() {
+                    sessions.push((path, mtime));
                 }
             }
         }
@@ -293,24 +298,28 @@ fn cmd_sessions_jq(path: &Path, filter: &str) -> i32 {
         }
     };
 
-    let reader = BufReader::new(file);
+    let mut reader = BufReader::with_capacity(LOG_READ_BUFFER_SIZE, file);
     let stdout = std::io::stdout();
     let mut stdout = stdout.lock();
 
-    for line in reader.lines() {
-        let line = match line {
-            Ok(l) => l,
+    // Parse lines straight from bytes, reusing one buffer
+    let mut line = Vec::new();
+    loop {
+        line.clear();
+        match reader.read_until(b'\n', &mut line) {
+            Ok(0) => break,
+            Ok(_) => {}
             Err(e) => {
                 eprintln!("Read error: {}", e);
                 return 1;
             }
-        };
+        }
 
-        if line.trim().is_empty() {
+        if line.iter().all(u8::is_ascii_whitespace) {
             continue;
         }
 
-        let json_val: serde_json::Value = match serde_json::from_str(&line) {
+        let json_val: serde_json::Value = match serde_json::from_slice(&line) {
             Ok(v) => v,
             Err(_) => continue,
         };
@@ -420,12 +429,8 @@ fn resolve_session_paths(session_id: &str, project: Option<&Path>) -> Vec<PathBu
         }
     }
 
-    // Sort by modification time (newest first)
-    matches.sort_by(|a, b| {
-        let mtime_a = a.metadata().and_then(|m| m.modified()).ok();
-        let mtime_b = b.metadata().and_then(|m| m.modified()).ok();
-        mtime_b.cmp(&mtime_a)
-    });
+    // Sort by modification time (newest first), one stat per file
+    matches.sort_by_cached_key(|p| std::cmp::Reverse(p.metadata().and_then(|m| m.modified()).ok()));
 
     // If not a glob pattern, return only the first match
     if !is_glob && matches.len() > 1 {
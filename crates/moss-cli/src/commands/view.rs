@@ -3,9 +3,14 @@
 use crate::commands::filter::detect_project_languages;
 use crate::config::MossConfig;
 use crate::filter::Filter;
+use crate::parsers::Parsers;
 use crate::tree::{FormatOptions, ViewNode, ViewNodeKind};
 use crate::{daemon, deps, index, path_resolve, skeleton, symbols, tree};
 use moss_languages::support_for_path;
+use rayon::prelude::*;
+use std::collections::{HashMap, HashSet};
+use std::fmt::Write as _;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
 
 /// Check if a file has language support (symbols can be extracted)
@@ -395,17 +400,20 @@ fn cmd_view_directory(
     }
     let (file_count, dir_count) = count_nodes(&view_node);
 
+    // Large trees print thousands of lines; buffer them instead of a write per line
+    let mut out = BufWriter::new(std::io::stdout().lock());
     if json {
         // Serialize the ViewNode directly for structured output
-        println!("{}", serde_json::to_string(&view_node).unwrap());
+        let _ = serde_json::to_writer(&mut out, &view_node);
+        let _ = writeln!(out);
     } else {
         // Format as text tree
         let lines = tree::format_view_node(&view_node, &FormatOptions::default());
         for line in &lines {
-            println!("{}", line);
+            let _ = writeln!(out, "{}", line);
         }
-        println!();
-        println!("{} directories, {} files", dir_count, file_count);
+        let _ = writeln!(out);
+        let _ = writeln!(out, "{} directories, {} files", dir_count, file_count);
     }
     0
 }
@@ -461,6 +469,107 @@ fn resolve_import(module: &str, current_file: &Path, root: &Path) -> Option<Path
         .map(|pkg| pkg.path)
 }
 
+/// Formatted skeleton of a module. Goes through the skeleton cache, since
+/// the same barrel targets are reached from many imports.
+fn cached_skeleton_lines(
+    path: &Path,
+    types_only: bool,
+    format_options: &FormatOptions,
+) -> Vec<String> {
+    let Some(skeleton) = skeleton::extract_file_cached(path) else {
+        return Vec::new();
+    };
+    let view_node = if types_only {
+        skeleton.filter_types().to_view_node()
+    } else {
+        skeleton.to_view_node()
+    };
+    tree::format_view_node(&view_node, format_options)
+}
+
+/// Render the skeleton of an imported module for fisheye view, following
+/// barrel file re-exports one level deep.
+fn render_imported_module(
+    module_name: &str,
+    resolved_path: &Path,
+    display: &str,
+    root: &Path,
+    types_only: bool,
+) -> String {
+    let mut out = String::new();
+    let Ok(import_content) = std::fs::read_to_string(resolved_path) else {
+        return out;
+    };
+    // Parse once; the skeleton and the re-export scan share the tree
+    let Some(support) = support_for_path(resolved_path) else {
+        return out;
+    };
+    let Some(parsed) = Parsers::new().parse_with_grammar(support.grammar_name(), &import_content)
+    else {
+        return out;
+    };
+    let format_options = FormatOptions {
+        docstrings: false,
+        line_numbers: true,
+        skip_root: true,
+        max_depth: None,
+    };
+
+    let import_skeleton = skeleton::SkeletonExtractor::new().extract_tree(
+        resolved_path,
+        &import_content,
+        &parsed,
+        support,
+    );
+    let view_node = if types_only {
+        import_skeleton.filter_types().to_view_node()
+    } else {
+        import_skeleton.to_view_node()
+    };
+    let lines = tree::format_view_node(&view_node, &format_options);
+    if !lines.is_empty() {
+        writeln!(out, "\n### {} ({})", module_name, display).unwrap();
+        for line in lines {
+            writeln!(out, "{}", line).unwrap();
+        }
+    }
+
+    // Check for barrel file re-exports and follow them
+    let import_deps =
+        deps::DepsExtractor::new().extract_tree(resolved_path, &import_content, &parsed, support);
+    for reexp in &import_deps.reexports {
+        let Some(reexp_path) = resolve_import(&reexp.module, resolved_path, root) else {
+            continue;
+        };
+        let lines = cached_skeleton_lines(&reexp_path, types_only, &format_options);
+        if !lines.is_empty() {
+            let reexp_display = reexp_path
+                .strip_prefix(root)
+                .map(|p| p.display().to_string())
+                .unwrap_or_else(|_| format!("[{}]", reexp.module));
+            let export_desc = if reexp.is_star {
+                format!("export * from '{}'", reexp.module)
+            } else {
+                format!(
+                    "export {{ {} }} from '{}'",
+                    reexp.names.join(", "),
+                    reexp.module
+                )
+            };
+            writeln!(
+                out,
+                "\n### {} → {} ({})",
+                module_name, export_desc, reexp_display
+            )
+            .unwrap();
+            for line in lines {
+                writeln!(out, "{}", line).unwrap();
+            }
+        }
+    }
+    out
+}
+
 fn cmd_view_file(
     file_path: &str,
     root: &Path,
@@ -515,7 +624,17 @@ fn cmd_view_file(
     } else {
         skeleton::SkeletonExtractor::new()
     };
-    let skeleton_result = extractor.extract(&full_path, &content);
+
+    // Parse once; the skeleton and deps passes share the tree
+    let parsed = support_for_path(&full_path).and_then(|support| {
+        Parsers::new()
+            .parse_with_grammar(support.grammar_name(), &content)
+            .map(|tree| (support, tree))
+    });
+    let skeleton_result = match &parsed {
+        Some((support, tree)) => extractor.extract_tree(&full_path, &content, tree, *support),
+        None => extractor.extract(&full_path, &content),
+    };
 
     // Filter to types only if requested
     let skeleton_result = if types_only {
@@ -527,7 +646,12 @@ fn cmd_view_file(
     // Get deps if showing deps, focus, resolve_imports, or context mode
     let deps_result = if show_deps || focus.is_some() || resolve_imports || context {
         let deps_extractor = deps::DepsExtractor::new();
-        Some(deps_extractor.extract(&full_path, &content))
+        Some(match &parsed {
+            Some((support, tree)) => {
+                deps_extractor.extract_tree(&full_path, &content, tree, *support)
+            }
+            None => deps_extractor.extract(&full_path, &content),
+        })
     } else {
         None
     };
@@ -619,84 +743,23 @@ fn cmd_view_file(
 
             if !resolved.is_empty() {
                 println!("\n## Imported Modules (Skeletons)");
-                let deps_extractor = deps::DepsExtractor::new();
-
-                for (module_name, resolved_path, display) in resolved {
-                    if let Ok(import_content) = std::fs::read_to_string(&resolved_path) {
-                        let import_extractor = skeleton::SkeletonExtractor::new();
-                        let import_skeleton =
-                            import_extractor.extract(&resolved_path, &import_content);
-                        let import_skeleton = if types_only {
-                            import_skeleton.filter_types()
-                        } else {
-                            import_skeleton
-                        };
 
-                        let view_node = import_skeleton.to_view_node();
-                        let format_options = FormatOptions {
-                            docstrings: false,
-                            line_numbers: true,
-                            skip_root: true,
-                            max_depth: None,
-                        };
-                        let lines = tree::format_view_node(&view_node, &format_options);
-                        if !lines.is_empty() {
-                            println!("\n### {} ({})", module_name, display);
-                            for line in lines {
-                                println!("{}", line);
-                            }
-                        }
-
-                        // Check for barrel file re-exports and follow them
-                        let import_deps = deps_extractor.extract(&resolved_path, &import_content);
-                        for reexp in &import_deps.reexports {
-                            if let Some(reexp_path) =
-                                resolve_import(&reexp.module, &resolved_path, root)
-                            {
-                                if let Ok(reexp_content) = std::fs::read_to_string(&reexp_path) {
-                                    let reexp_extractor = skeleton::SkeletonExtractor::new();
-                                    let reexp_skeleton =
-                                        reexp_extractor.extract(&reexp_path, &reexp_content);
-                                    let reexp_skeleton = if types_only {
-                                        reexp_skeleton.filter_types()
-                                    } else {
-                                        reexp_skeleton
-                                    };
-
-                                    let view_node = reexp_skeleton.to_view_node();
-                                    let format_options = FormatOptions {
-                                        docstrings: false,
-                                        line_numbers: true,
-                                        skip_root: true,
-                                        max_depth: None,
-                                    };
-                                    let lines = tree::format_view_node(&view_node, &format_options);
-                                    if !lines.is_empty() {
-                                        let reexp_display = reexp_path
-                                            .strip_prefix(root)
-                                            .map(|p| p.display().to_string())
-                                            .unwrap_or_else(|_| format!("[{}]", reexp.module));
-                                        let export_desc = if reexp.is_star {
-                                            format!("export * from '{}'", reexp.module)
-                                        } else {
-                                            format!(
-                                                "export {{ {} }} from '{}'",
-                                                reexp.names.join(", "),
-                                                reexp.module
-                                            )
-                                        };
-                                        println!(
-                                            "\n### {} → {} ({})",
-                                            module_name, export_desc, reexp_display
-                                        );
-                                        for line in lines {
-                                            println!("{}", line);
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                // Imports are read and extracted independently; render them in
+                // parallel, then print in import order
+                let sections: Vec<String> = resolved
+                    .par_iter()
+                    .map(|(module_name, resolved_path, display)| {
+                        render_imported_module(
+                            module_name,
+                            resolved_path,
+                            display,
+                            root,
+                            types_only,
+                        )
+                    })
+                    .collect();
+                for section in sections {
+                    print!("{}", section);
                 }
             }
         }
@@ -707,23 +770,35 @@ fn cmd_view_file(
 
             let mut resolved_symbols: Vec<(String, String, String)> = Vec::new();
 
-            for imp in &deps.imports {
-                if imp.names.is_empty() {
-                    continue;
-                }
+            let imports: Vec<_> = deps
+                .imports
+                .iter()
+                .filter(|imp| !imp.names.is_empty())
+                .filter_map(|imp| Some((imp, resolve_import(&imp.module, &full_path, root)?)))
+                .collect();
+
+            // Separate import statements often resolve to the same file (e.g. a
+            // type-only and a value import); read and extract each file once,
+            // fanning the reads out across threads
+            let targets: HashSet<&PathBuf> = imports.iter().map(|(_, path)| path).collect();
+            let skeletons: HashMap<&PathBuf, skeleton::SkeletonResult> = targets
+                .into_par_iter()
+                .filter_map(|path| {
+                    let content = std::fs::read_to_string(path).ok()?;
+                    Some((
+                        path,
+                        skeleton::SkeletonExtractor::new().extract(path, &content),
+                    ))
+                })
+                .collect();
 
-                if let Some(resolved_path) = resolve_import(&imp.module, &full_path, root) {
-                    if let Ok(import_content) = std::fs::read_to_string(&resolved_path) {
-                        let import_extractor = skeleton::SkeletonExtractor::new();
-                        let import_skeleton =
-                            import_extractor.extract(&resolved_path, &import_content);
-
-                        for name in &imp.names {
-                            if let Some(sig) = find_symbol_signature(&import_skeleton.symbols, name)
-                            {
-                                resolved_symbols.push((imp.module.clone(), name.clone(), sig));
-                            }
-                        }
+            for (imp, resolved_path) in &imports {
+                let Some(import_skeleton) = skeletons.get(resolved_path) else {
+                    continue;
+                };
+                for name in &imp.names {
+                    if let Some(sig) = find_symbol_signature(&import_skeleton.symbols, name) {
+                        resolved_symbols.push((imp.module.clone(), name.clone(), sig));
                     }
                 }
             }
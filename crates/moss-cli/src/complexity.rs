@@ -68,26 +68,30 @@ pub struct ComplexityReport {
     pub file_path: String,
 }
 
+/// Summary figures for a complexity report
+#[derive(Debug, Clone, Copy, Default)]
+pub struct ComplexityTotals {
+    pub avg_complexity: f64,
+    pub max_complexity: usize,
+    pub high_risk_count: usize,
+}
+
 impl ComplexityReport {
-    pub fn avg_complexity(&self) -> f64 {
-        if self.functions.is_empty() {
-            0.0
-        } else {
-            let total: usize = self.functions.iter().map(|f| f.complexity).sum();
-            total as f64 / self.functions.len() as f64
+    /// Average, maximum and high-risk count, computed in a single pass.
+    pub fn totals(&self) -> ComplexityTotals {
+        let mut sum = 0;
+        let mut totals = ComplexityTotals::default();
+        for f in &self.functions {
+            sum += f.complexity;
+            totals.max_complexity = totals.max_complexity.max(f.complexity);
+            if f.complexity > 10 {
+                totals.high_risk_count += 1;
+            }
         }
-    }
-
-    pub fn max_complexity(&self) -> usize {
-        self.functions
-            .iter()
-            .map(|f| f.complexity)
-            .max()
-            .unwrap_or(0)
-    }
-
-    pub fn high_risk_count(&self) -> usize {
-        self.functions.iter().filter(|f| f.complexity > 10).count()
+        if !self.functions.is_empty() {
+            totals.avg_complexity = sum as f64 / self.functions.len() as f64;
+        }
+        totals
     }
 }
 
@@ -114,16 +118,37 @@ impl ComplexityAnalyzer {
         }
     }
 
+    /// Analyze a tree already parsed with `support`'s grammar.
+    pub fn analyze_tree(
+        &self,
+        path: &Path,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> ComplexityReport {
+        ComplexityReport {
+            functions: self.functions_in_tree(tree, content, support),
+            file_path: path.to_string_lossy().to_string(),
+        }
+    }
+
     /// Analyze using the Language trait
     fn analyze_with_trait(&self, content: &str, support: &dyn Language) -> Vec<FunctionComplexity> {
-        let tree = match self
+        match self
             .parsers
             .parse_with_grammar(support.grammar_name(), content)
         {
-            Some(t) => t,
-            None => return Vec::new(),
-        };
+            Some(tree) => self.functions_in_tree(&tree, content, support),
+            None => Vec::new(),
+        }
+    }
 
+    fn functions_in_tree(
+        &self,
+        tree: &tree_sitter::Tree,
+        content: &str,
+        support: &dyn Language,
+    ) -> Vec<FunctionComplexity> {
         let mut functions = Vec::new();
         let root = tree.root_node();
         let mut cursor = root.walk();
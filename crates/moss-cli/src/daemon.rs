@@ -1,17 +1,19 @@
 use crate::config::MossConfig;
 use crate::paths::get_moss_dir;
+use ignore::gitignore::Gitignore;
 use notify::{Config, RecommendedWatcher, RecursiveMode, Watcher};
 use serde::{Deserialize, Serialize};
 use std::io::{BufRead, BufReader, Read, Write};
 use std::os::unix::net::UnixStream;
 use std::path::{Path, PathBuf};
-use std::sync::mpsc::channel;
+use std::sync::mpsc::{channel, RecvTimeoutError};
 use std::sync::{Arc, Mutex};
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt};
 use tokio::net::UnixListener;
 
 use crate::index::FileIndex;
+use crate::symbols::read_line_range;
 
 #[derive(Debug, Serialize, Deserialize)]
 #[serde(tag = "cmd")]
@@ -404,14 +406,8 @@ impl DaemonServer {
                     Ok(matches) if !matches.is_empty() => {
                         let (file_path, _, start, end) = &matches[0];
                         let abs_path = self.root.join(file_path);
-                        match std::fs::read_to_string(&abs_path) {
-                            Ok(content) => {
-                                let lines: Vec<&str> = content.lines().collect();
-                                let start_idx = (*start).saturating_sub(1);
-                                let end_idx = (*end).min(lines.len());
-                                let source = lines[start_idx..end_idx].join("\n");
-                                ServerResponse::ok(serde_json::json!({"source": source}))
-                            }
+                        match read_line_range(&abs_path, *start, *end) {
+                            Ok(source) => ServerResponse::ok(serde_json::json!({"source": source})),
                             Err(e) => ServerResponse::err(&e.to_string()),
                         }
                     }
@@ -482,6 +478,23 @@ impl DaemonServer {
     }
 }
 
+/// Whether a changed path can affect the index. Paths under `.git` or `.moss`,
+/// or ignored by the root `.gitignore`, are never indexed.
+fn is_indexable_change(path: &Path, root: &Path, gitignore: &Gitignore) -> bool {
+    let Ok(rel) = path.strip_prefix(root) else {
+        return true;
+    };
+    if rel
+        .components()
+        .any(|c| c.as_os_str() == ".git" || c.as_os_str() == ".moss")
+    {
+        return false;
+    }
+    !gitignore
+        .matched_path_or_any_parents(path, path.is_dir())
+        .is_ignore()
+}
+
 /// Run the daemon server in the foreground
 #[tokio::main]
 pub async fn run_daemon(root: &Path) -> Result<i32, Box<dyn std::error::Error>> {
@@ -525,26 +538,47 @@ pub async fn run_daemon(root: &Path) -> Result<i32, Box<dyn std::error::Error>>
             return;
         }
 
-        // Batch file changes - don't reindex on every keystroke
-        use std::time::Instant;
-        let mut last_refresh = Instant::now();
+        // Batch file changes - don't reindex on every keystroke. The first
+        // change opens a window; everything arriving within it (e.g. a whole
+        // git checkout) is picked up by a single refresh when it closes, so
+        // trailing changes in a burst are never dropped.
         let debounce = Duration::from_millis(500);
+        let mut deadline: Option<Instant> = None;
+
+        let gitignore_path = root_watcher.join(".gitignore");
+        let mut gitignore = Gitignore::new(&gitignore_path).0;
+
+        loop {
+            let res = match deadline {
+                Some(at) => match rx.recv_timeout(at.saturating_duration_since(Instant::now())) {
+                    Ok(res) => res,
+                    Err(RecvTimeoutError::Timeout) => {
+                        server_watcher.trigger_incremental_refresh();
+                        deadline = None;
+                        continue;
+                    }
+                    Err(RecvTimeoutError::Disconnected) => break,
+                },
+                None => match rx.recv() {
+                    Ok(res) => res,
+                    Err(_) => break,
+                },
+            };
 
-        for res in rx {
             if let Ok(event) = res {
-                // Skip .moss directory
-                let dominated_by_moss = event
-                    .paths
-                    .iter()
-                    .all(|p| p.to_string_lossy().contains(".moss"));
-                if dominated_by_moss {
-                    continue;
+                // Pick up .gitignore edits before classifying this event
+                if event.paths.iter().any(|p| *p == gitignore_path) {
+                    gitignore = Gitignore::new(&gitignore_path).0;
                 }
 
-                // Debounce: only refresh if enough time has passed
-                if last_refresh.elapsed() >= debounce {
-                    server_watcher.trigger_incremental_refresh();
-                    last_refresh = Instant::now();
+                // Builds, git operations and our own index writes only touch
+                // paths the index never contains; don't refresh for them
+                let relevant = event
+                    .paths
+                    .iter()
+                    .any(|p| is_indexable_change(p, &root_watcher, &gitignore));
+                if relevant && deadline.is_none() {
+                    deadline = Some(Instant::now() + debounce);
                 }
             }
         }
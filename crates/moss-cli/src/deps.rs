@@ -187,22 +187,49 @@ impl DepsExtractor {
         }
     }
 
+    /// Extract from a tree already parsed with `support`'s grammar.
+    pub fn extract_tree(
+        &self,
+        path: &Path,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> DepsResult {
+        let extracted = match support.grammar_name() {
+            // JS/TS need special handling for re-exports
+            "javascript" | "typescript" | "tsx" => self.extract_js_ts_deps(tree, content),
+            _ => self.deps_in_tree(tree, content, support),
+        };
+
+        DepsResult {
+            imports: extracted.imports,
+            exports: extracted.exports,
+            reexports: extracted.reexports,
+            file_path: path.to_string_lossy().to_string(),
+        }
+    }
+
     /// Extract using the Language trait
     fn extract_with_trait(&self, content: &str, support: &dyn Language) -> ExtractedDeps {
-        let tree = match self
+        match self
             .parsers
             .parse_with_grammar(support.grammar_name(), content)
         {
-            Some(t) => t,
-            None => {
-                return ExtractedDeps {
-                    imports: Vec::new(),
-                    exports: Vec::new(),
-                    reexports: Vec::new(),
-                }
-            }
-        };
+            Some(tree) => self.deps_in_tree(&tree, content, support),
+            None => ExtractedDeps {
+                imports: Vec::new(),
+                exports: Vec::new(),
+                reexports: Vec::new(),
+            },
+        }
+    }
 
+    fn deps_in_tree(
+        &self,
+        tree: &tree_sitter::Tree,
+        content: &str,
+        support: &dyn Language,
+    ) -> ExtractedDeps {
         let mut imports = Vec::new();
         let mut exports = Vec::new();
         let root = tree.root_node();
@@ -57,15 +57,36 @@ impl Extractor {
         }
     }
 
+    /// Extract symbols from a tree already parsed with `support`'s grammar.
+    pub fn extract_tree(
+        &self,
+        path: &Path,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> ExtractResult {
+        ExtractResult {
+            symbols: self.symbols_in_tree(tree, content, support),
+            file_path: path.to_string_lossy().to_string(),
+        }
+    }
+
     fn extract_with_support(&self, content: &str, support: &dyn Language) -> Vec<Symbol> {
-        let tree = match self
+        match self
             .parsers
             .parse_with_grammar(support.grammar_name(), content)
         {
-            Some(t) => t,
-            None => return Vec::new(),
-        };
+            Some(tree) => self.symbols_in_tree(&tree, content, support),
+            None => Vec::new(),
+        }
+    }
 
+    fn symbols_in_tree(
+        &self,
+        tree: &tree_sitter::Tree,
+        content: &str,
+        support: &dyn Language,
+    ) -> Vec<Symbol> {
         let mut symbols = Vec::new();
         let root = tree.root_node();
         let mut cursor = root.walk();
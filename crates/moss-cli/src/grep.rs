@@ -4,15 +4,20 @@ use crate::filter::Filter;
 use crate::output::OutputFormatter;
 use grep_matcher::Matcher;
 use grep_regex::RegexMatcher;
-use grep_searcher::sinks::UTF8;
-use grep_searcher::Searcher;
+use grep_searcher::sinks::Bytes;
+use grep_searcher::{MmapChoice, SearcherBuilder};
 use ignore::WalkBuilder;
 use std::fmt::Write;
+use std::fs::File;
 use std::io;
 use std::path::Path;
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::Mutex;
 
+/// Files at least this large are memory-mapped; smaller ones use buffered
+/// reads, where the cost of setting up a mapping outweighs the copy saved.
+const MMAP_MIN_LEN: u64 = 1 << 20;
+
 /// A single match result
 #[derive(Debug, Clone, serde::Serialize)]
 pub struct GrepMatch {
@@ -62,6 +67,14 @@ pub fn grep(
     let walker = builder.build_parallel();
 
     walker.run(|| {
+        // Two searchers per worker thread: buffered reads for most files, and
+        // memory maps for files of at least MMAP_MIN_LEN bytes.
+        // SAFETY: a file truncated while mapped may SIGBUS; ripgrep accepts
+        // the same tradeoff for the files it maps.
+        let mut searcher = SearcherBuilder::new().build();
+        let mut mmap_searcher = SearcherBuilder::new()
+            .memory_map(unsafe { MmapChoice::auto() })
+            .build();
         let matcher = &matcher;
         let matches = &matches;
         let total_matches = &total_matches;
@@ -90,8 +103,10 @@ pub fn grep(
 
             files_searched.fetch_add(1, Ordering::Relaxed);
 
-            let mut searcher = Searcher::new();
+            // No file can contribute more than `limit` results, so matches
+            // past that are only counted, never materialized.
             let mut file_matches: Vec<GrepMatch> = Vec::new();
+            let mut file_match_count = 0usize;
 
             let rel_path = path
                 .strip_prefix(root)
@@ -99,14 +114,29 @@ pub fn grep(
                 .to_string_lossy()
                 .to_string();
 
-            let _ = searcher.search_path(
+            // One open serves both the size check and the search
+            let Ok(file) = File::open(path) else {
+                return ignore::WalkState::Continue;
+            };
+            let large = file.metadata().is_ok_and(|m| m.len() >= MMAP_MIN_LEN);
+            let searcher = if large {
+                &mut mmap_searcher
+            } else {
+                &mut searcher
+            };
+            let _ = searcher.search_file(
                 matcher,
-                path,
-                UTF8(|line_num, line| {
-                    // Find match positions
+                &file,
+                Bytes(|line_num, line| {
+                    file_match_count += 1;
+                    if file_matches.len() >= limit {
+                        return Ok(true);
+                    }
+
+                    // Match on raw bytes; only the emitted line is decoded
                     let mut start = 0;
                     let mut end = 0;
-                    if let Ok(Some(m)) = matcher.find(line.as_bytes()) {
+                    if let Ok(Some(m)) = matcher.find(line) {
                         start = m.start();
                         end = m.end();
                     }
@@ -114,7 +144,7 @@ pub fn grep(
                     file_matches.push(GrepMatch {
                         file: rel_path.clone(),
                         line: line_num as usize,
-                        content: line.trim_end().to_string(),
+                        content: String::from_utf8_lossy(line).trim_end().to_string(),
                         start,
                         end,
                     });
@@ -122,15 +152,12 @@ pub fn grep(
                 }),
             );
 
-            if !file_matches.is_empty() {
-                total_matches.fetch_add(file_matches.len(), Ordering::Relaxed);
+            if file_match_count > 0 {
+                total_matches.fetch_add(file_match_count, Ordering::Relaxed);
 
                 let mut guard = matches.lock().unwrap();
-                for m in file_matches {
-                    if guard.len() < limit {
-                        guard.push(m);
-                    }
-                }
+                let room = limit.saturating_sub(guard.len());
+                guard.extend(file_matches.into_iter().take(room));
 
                 // Stop early if we have enough matches
                 if guard.len() >= limit {
@@ -195,6 +222,17 @@ mod tests {
         assert_eq!(result.total_matches, 2);
     }
 
+    #[test]
+    fn test_grep_invalid_utf8() {
+        let dir = TempDir::new().unwrap();
+        let file = dir.path().join("test.bin");
+        fs::write(&file, b"\xff\xfe hello\nhello world\n").unwrap();
+
+        let result = grep("hello", dir.path(), None, 100, false).unwrap();
+        assert_eq!(result.total_matches, 2);
+        assert_eq!(result.matches[1].content, "hello world");
+    }
+
     #[test]
     fn test_grep_limit() {
         let dir = TempDir::new().unwrap();
@@ -203,6 +241,6 @@ mod tests {
 
         let result = grep("a", dir.path(), None, 2, false).unwrap();
         assert_eq!(result.matches.len(), 2);
-        assert!(result.total_matches >= 2);
+        assert_eq!(result.total_matches, 5);
     }
 }
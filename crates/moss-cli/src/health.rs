@@ -20,6 +20,13 @@ const LARGE_THRESHOLD: usize = 500;
 const VERY_LARGE_THRESHOLD: usize = 1000;
 const MASSIVE_THRESHOLD: usize = 2000;
 
+/// Large files bucketed by severity
+struct LargeFileTiers<'a> {
+    massive: Vec<&'a LargeFile>,
+    very_large: Vec<&'a LargeFile>,
+    large: Vec<&'a LargeFile>,
+}
+
 /// Health metrics for a codebase
 #[derive(Debug)]
 pub struct HealthReport {
@@ -57,21 +64,11 @@ impl HealthReport {
         lines.push(format!("  High risk (>10): {}", self.high_risk_functions));
 
         // Categorize files by severity
-        let massive: Vec<_> = self
-            .large_files
-            .iter()
-            .filter(|f| f.lines >= MASSIVE_THRESHOLD)
-            .collect();
-        let very_large: Vec<_> = self
-            .large_files
-            .iter()
-            .filter(|f| f.lines >= VERY_LARGE_THRESHOLD && f.lines < MASSIVE_THRESHOLD)
-            .collect();
-        let large: Vec<_> = self
-            .large_files
-            .iter()
-            .filter(|f| f.lines >= LARGE_THRESHOLD && f.lines < VERY_LARGE_THRESHOLD)
-            .collect();
+        let LargeFileTiers {
+            massive,
+            very_large,
+            large,
+        } = self.large_file_tiers();
 
         if !massive.is_empty() {
             lines.push(String::new());
@@ -118,8 +115,8 @@ impl HealthReport {
             }
         }
 
-        let health_score = self.calculate_health_score();
-        let grade = self.grade();
+        let health_score = self.calculate_health_score(massive.len(), very_large.len());
+        let grade = Self::grade(health_score);
         lines.push(String::new());
         lines.push(format!(
             "## Score: {} ({:.0}%)",
@@ -130,7 +127,26 @@ impl HealthReport {
         lines.join("\n")
     }
 
-    fn calculate_health_score(&self) -> f64 {
+    /// Bucket large files by severity in a single pass.
+    fn large_file_tiers(&self) -> LargeFileTiers<'_> {
+        let mut tiers = LargeFileTiers {
+            massive: Vec::new(),
+            very_large: Vec::new(),
+            large: Vec::new(),
+        };
+        for f in &self.large_files {
+            if f.lines >= MASSIVE_THRESHOLD {
+                tiers.massive.push(f);
+            } else if f.lines >= VERY_LARGE_THRESHOLD {
+                tiers.very_large.push(f);
+            } else if f.lines >= LARGE_THRESHOLD {
+                tiers.large.push(f);
+            }
+        }
+        tiers
+    }
+
+    fn calculate_health_score(&self, massive_count: usize, very_large_count: usize) -> f64 {
         // Scoring based on complexity and file sizes
         // Lower average complexity = better
         // Lower high-risk ratio = better
@@ -171,17 +187,6 @@ impl HealthReport {
         };
 
         // Large file penalty: massive files are a serious problem
-        let massive_count = self
-            .large_files
-            .iter()
-            .filter(|f| f.lines >= MASSIVE_THRESHOLD)
-            .count();
-        let very_large_count = self
-            .large_files
-            .iter()
-            .filter(|f| f.lines >= VERY_LARGE_THRESHOLD && f.lines < MASSIVE_THRESHOLD)
-            .count();
-
         let file_size_score = if massive_count > 0 {
             // Any massive file is a critical issue
             0.3_f64.max(0.5 - (massive_count as f64 * 0.1))
@@ -198,8 +203,7 @@ impl HealthReport {
         (complexity_score * 0.3) + (risk_score * 0.3) + (file_size_score * 0.4)
     }
 
-    fn grade(&self) -> &'static str {
-        let score = self.calculate_health_score();
+    fn grade(score: f64) -> &'static str {
         if score >= 0.9 {
             "A"
         } else if score >= 0.8 {
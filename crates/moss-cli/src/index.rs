@@ -1,4 +1,4 @@
-use crate::paths::get_moss_dir;
+use crate::paths::{get_moss_dir, walk_entry_is_dir};
 use ignore::WalkBuilder;
 use moss_languages::support_for_path;
 use rayon::prelude::*;
@@ -11,10 +11,9 @@ use crate::symbols::{Import, Symbol, SymbolParser};
 /// Parsed data for a single file, ready for database insertion
 struct ParsedFileData {
     file_path: String,
-    /// (name, kind, start_line, end_line, parent, complexity)
-    symbols: Vec<(String, String, usize, usize, Option<String>, Option<usize>)>,
-    /// (caller_symbol, callee_name, callee_qualifier, line)
-    calls: Vec<(String, String, Option<String>, usize)>,
+    symbols: Vec<Symbol>,
+    /// (caller index into `symbols`, callee_name, callee_qualifier, line)
+    calls: Vec<(usize, String, Option<String>, usize)>,
     /// imports (for Python files only)
     imports: Vec<Import>,
 }
@@ -22,6 +21,10 @@ struct ParsedFileData {
 // Not yet public - just delete .moss/index.sqlite on schema changes
 const SCHEMA_VERSION: i64 = 5;
 
+/// Files this large or larger are indexed without reading their contents, and
+/// counted but not parsed by the overview. Past this size they are almost always generated.
+pub const MAX_READ_BYTES: u64 = 1_000_000;
+
 /// Supported source file extensions for call graph indexing
 const SOURCE_EXTENSIONS: &[&str] = &[
     ".py", ".rs", ".java", ".ts", ".tsx", ".js", ".mjs", ".cjs", ".go", ".json", ".yaml", ".yml",
@@ -274,7 +277,7 @@ impl FileIndex {
         let mut seen = std::collections::HashSet::new();
         for entry in walker.flatten() {
             let path = entry.path();
-            if path.is_dir() {
+            if walk_entry_is_dir(&entry) {
                 continue;
             }
             if let Ok(rel) = path.strip_prefix(&self.root) {
@@ -416,10 +419,11 @@ impl FileIndex {
         // Update/insert changed files
         for path in changed.added.iter().chain(changed.modified.iter()) {
             let full_path = self.root.join(path);
-            let is_dir = full_path.is_dir();
-            let mtime = full_path
-                .metadata()
-                .ok()
+            // One stat serves the dir check, mtime and size limit
+            let meta = full_path.metadata().ok();
+            let is_dir = meta.as_ref().is_some_and(|m| m.is_dir());
+            let mtime = meta
+                .as_ref()
                 .and_then(|m| m.modified().ok())
                 .and_then(|t| t.duration_since(UNIX_EPOCH).ok())
                 .map(|d| d.as_secs() as i64)
@@ -428,10 +432,7 @@ impl FileIndex {
             let lines = if is_dir {
                 0
             } else {
-                full_path
-                    .metadata()
-                    .ok()
-                    .filter(|m| m.len() < 1_000_000)
+                meta.filter(|m| m.len() < MAX_READ_BYTES)
                     .and_then(|_| std::fs::read_to_string(&full_path).ok())
                     .map(|s| s.lines().count())
                     .unwrap_or(0)
@@ -480,10 +481,11 @@ impl FileIndex {
                     continue;
                 }
 
-                let is_dir = path.is_dir();
-                let mtime = path
-                    .metadata()
-                    .ok()
+                // One stat serves the dir check, mtime and size limit
+                let meta = path.metadata().ok();
+                let is_dir = meta.as_ref().is_some_and(|m| m.is_dir());
+                let mtime = meta
+                    .as_ref()
                     .and_then(|m| m.modified().ok())
                     .and_then(|t| t.duration_since(UNIX_EPOCH).ok())
                     .map(|d| d.as_secs() as i64)
@@ -492,9 +494,7 @@ impl FileIndex {
                 let lines = if is_dir {
                     0
                 } else {
-                    path.metadata()
-                        .ok()
-                        .filter(|m| m.len() < 1_000_000)
+                    meta.filter(|m| m.len() < MAX_READ_BYTES)
                         .and_then(|_| std::fs::read_to_string(path).ok())
                         .map(|s| s.lines().count())
                         .unwrap_or(0)
@@ -1044,39 +1044,28 @@ impl FileIndex {
 
                 // Each thread creates its own parser
                 let mut parser = SymbolParser::new();
-                let symbols = parser.parse_file(&full_path, &content);
+                let parsed = parser.parse_file_with_imports(&full_path, &content);
 
-                let mut sym_data = Vec::with_capacity(symbols.len());
+                // Calls refer to their caller by index, so symbol names and
+                // kinds are never copied per symbol or per call
                 let mut call_data = Vec::new();
 
-                for sym in &symbols {
-                    sym_data.push((
-                        sym.name.clone(),
-                        sym.kind.as_str().to_string(),
-                        sym.start_line,
-                        sym.end_line,
-                        sym.parent.clone(),
-                        sym.complexity,
-                    ));
-
+                for (caller, sym) in parsed.symbols.iter().enumerate() {
                     // Only index calls for functions/methods
                     let kind = sym.kind.as_str();
                     if kind == "function" || kind == "method" {
                         let calls = parser.find_callees_for_symbol(&full_path, &content, sym);
                         for (callee_name, line, qualifier) in calls {
-                            call_data.push((sym.name.clone(), callee_name, qualifier, line));
+                            call_data.push((caller, callee_name, qualifier, line));
                         }
                     }
                 }
 
-                // Parse imports using trait-based extraction (works for all supported languages)
-                let imports = parser.parse_imports(&full_path, &content);
-
                 Some(ParsedFileData {
                     file_path: file_path.clone(),
-                    symbols: sym_data,
+                    symbols: parsed.symbols,
                     calls: call_data,
-                    imports,
+                    imports: parsed.imports,
                 })
             })
             .collect();
@@ -1104,23 +1093,23 @@ impl FileIndex {
             )?;
 
             for data in &parsed_data {
-                for (name, kind, start_line, end_line, parent, complexity) in &data.symbols {
+                for sym in &data.symbols {
                     sym_stmt.execute(params![
                         data.file_path,
-                        name,
-                        kind,
-                        start_line,
-                        end_line,
-                        parent,
-                        complexity
+                        sym.name,
+                        sym.kind.as_str(),
+                        sym.start_line,
+                        sym.end_line,
+                        sym.parent,
+                        sym.complexity
                     ])?;
                     symbol_count += 1;
                 }
 
-                for (caller_symbol, callee_name, qualifier, line) in &data.calls {
+                for (caller, callee_name, qualifier, line) in &data.calls {
                     call_stmt.execute(params![
                         data.file_path,
-                        caller_symbol,
+                        data.symbols[*caller].name,
                         callee_name,
                         qualifier,
                         line
@@ -1194,9 +1183,9 @@ impl FileIndex {
                 Err(_) => continue,
             };
 
-            let symbols = parser.parse_file(&full_path, &content);
+            let parsed = parser.parse_file_with_imports(&full_path, &content);
 
-            for sym in &symbols {
+            for sym in &parsed.symbols {
                 tx.execute(
                     "INSERT INTO symbols (file, name, kind, start_line, end_line, parent, complexity) VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7)",
                     params![file_path, sym.name, sym.kind.as_str(), sym.start_line, sym.end_line, sym.parent, sym.complexity],
@@ -1216,9 +1205,8 @@ impl FileIndex {
                 }
             }
 
-            // Parse imports using trait-based extraction (works for all supported languages)
-            let imports = parser.parse_imports(&full_path, &content);
-            for imp in imports {
+            // Imports come from the same parse (works for all supported languages)
+            for imp in parsed.imports {
                 tx.execute(
                     "INSERT INTO imports (file, module, name, alias, line) VALUES (?1, ?2, ?3, ?4, ?5)",
                     params![file_path, imp.module, imp.name, imp.alias, imp.line],
@@ -3,6 +3,7 @@
 //! Provides consistent JSON/text output across all commands via the `OutputFormatter` trait.
 
 use serde::Serialize;
+use std::io::{BufWriter, Write};
 
 /// Output format mode.
 #[derive(Debug, Clone, Default, PartialEq, Eq)]
@@ -45,11 +46,14 @@ pub trait OutputFormatter: Serialize {
         match format {
             OutputFormat::Text => println!("{}", self.format_text()),
             OutputFormat::Json => {
-                println!("{}", serde_json::to_string(self).unwrap_or_default())
+                // Serialize straight into a buffered stdout, no intermediate String
+                let mut out = BufWriter::new(std::io::stdout().lock());
+                let _ = serde_json::to_writer(&mut out, self);
+                let _ = writeln!(out);
             }
             OutputFormat::Jq(filter) => {
                 let json = serde_json::to_value(self).unwrap_or_default();
-                match apply_jq(&json, filter) {
+                match apply_jq(json, filter) {
                     Ok(results) => {
                         for result in results {
                             println!("{}", result);
@@ -65,7 +69,10 @@ pub trait OutputFormatter: Serialize {
 }
 
 /// Apply a jq filter to a JSON value.
-pub fn apply_jq(value: &serde_json::Value, filter: &str) -> Result<Vec<String>, String> {
+///
+/// Takes the value by ownership so it converts into jaq's representation
+/// without a deep clone.
+pub fn apply_jq(value: serde_json::Value, filter: &str) -> Result<Vec<String>, String> {
     use jaq_core::load::{Arena, File as JaqFile, Loader};
     use jaq_core::{Compiler, Ctx, RcIter};
     use jaq_json::Val;
@@ -87,7 +94,7 @@ pub fn apply_jq(value: &serde_json::Value, filter: &str) -> Result<Vec<String>,
         .compile(modules)
         .map_err(|errs| format!("jq compile error: {:?}", errs))?;
 
-    let val = Val::from(value.clone());
+    let val = Val::from(value);
     let inputs = RcIter::new(core::iter::empty());
     let out = filter_compiled.run((Ctx::new([], &inputs), val));
 
@@ -135,10 +142,10 @@ mod tests {
     #[test]
     fn test_apply_jq() {
         let value = serde_json::json!({"name": "test", "count": 42});
-        let results = apply_jq(&value, ".name").unwrap();
+        let results = apply_jq(value.clone(), ".name").unwrap();
         assert_eq!(results, vec!["\"test\""]);
 
-        let results = apply_jq(&value, ".count").unwrap();
+        let results = apply_jq(value, ".count").unwrap();
         assert_eq!(results, vec!["42"]);
     }
 }
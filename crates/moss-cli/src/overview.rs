@@ -8,12 +8,13 @@
 
 use std::collections::HashMap;
 use std::path::Path;
-use std::sync::Mutex;
 
 use rayon::prelude::*;
 
 use crate::complexity::ComplexityAnalyzer;
 use crate::deps::DepsExtractor;
+use crate::index;
+use crate::parsers::Parsers;
 use crate::path_resolve;
 use crate::skeleton::SkeletonExtractor;
 
@@ -204,6 +205,7 @@ impl OverviewReport {
 
 /// Per-file stats for parallel aggregation
 struct FileStats {
+    language: Option<&'static str>,
     lines: usize,
     functions: usize,
     classes: usize,
@@ -218,55 +220,74 @@ struct FileStats {
     fixmes: usize,
 }
 
+impl FileStats {
+    /// Stats for a file that is counted but not parsed
+    fn text_only(
+        language: Option<&'static str>,
+        lines: usize,
+        todos: usize,
+        fixmes: usize,
+    ) -> Self {
+        Self {
+            language,
+            lines,
+            functions: 0,
+            classes: 0,
+            methods: 0,
+            functions_with_docs: 0,
+            complexity_sum: 0,
+            max_complexity: 0,
+            high_risk: 0,
+            imports: 0,
+            modules: Vec::new(),
+            todos,
+            fixmes,
+        }
+    }
+}
+
 /// Analyze codebase and produce overview report
 pub fn analyze_overview(root: &Path) -> OverviewReport {
     let all_files = path_resolve::all_files(root);
     let files: Vec<_> = all_files.iter().filter(|f| f.kind == "file").collect();
 
-    // Thread-safe language file counts
-    let files_by_language: Mutex<HashMap<String, usize>> = Mutex::new(HashMap::new());
-
-    // Process files in parallel
+    // Process files in parallel; workers share no state and results are
+    // merged serially below
     let stats: Vec<FileStats> = files
         .par_iter()
-        .filter_map(|file| {
+        .map(|file| {
             let path = root.join(&file.path);
             let lang = moss_languages::support_for_path(&path);
+            let language = lang.map(|l| l.name());
 
-            // Count files by language
-            if let Some(l) = lang {
-                let mut counts = files_by_language.lock().unwrap();
-                *counts.entry(l.name().to_string()).or_insert(0) += 1;
-            }
-
-            let content = std::fs::read_to_string(&path).ok()?;
+            // Unreadable files still count toward the language breakdown
+            let Ok(content) = std::fs::read_to_string(&path) else {
+                return FileStats::text_only(language, 0, 0, 0);
+            };
             let lines = content.lines().count();
 
             // Count TODOs and FIXMEs
             let todos = content.matches("TODO").count();
             let fixmes = content.matches("FIXME").count();
 
-            // Skip detailed analysis for files without language support
-            if lang.is_none() || !lang.unwrap().has_symbols() {
-                return Some(FileStats {
-                    lines,
-                    functions: 0,
-                    classes: 0,
-                    methods: 0,
-                    functions_with_docs: 0,
-                    complexity_sum: 0,
-                    max_complexity: 0,
-                    high_risk: 0,
-                    imports: 0,
-                    modules: Vec::new(),
-                    todos,
-                    fixmes,
-                });
-            }
+            // Skip detailed analysis for unsupported files, and for files the
+            // index also treats as too large to read
+            let Some(support) =
+                lang.filter(|l| l.has_symbols() && (content.len() as u64) < index::MAX_READ_BYTES)
+            else {
+                return FileStats::text_only(language, lines, todos, fixmes);
+            };
+
+            // Parse once; the complexity, skeleton and deps passes share the tree
+            let Some(tree) = Parsers::new().parse_with_grammar(support.grammar_name(), &content)
+            else {
+                return FileStats::text_only(language, lines, todos, fixmes);
+            };
 
             // Complexity analysis
             let complexity_analyzer = ComplexityAnalyzer::new();
-            let complexity_report = complexity_analyzer.analyze(&path, &content);
+            let complexity_report =
+                complexity_analyzer.analyze_tree(&path, &content, &tree, support);
 
             let mut functions = 0;
             let mut complexity_sum = 0;
@@ -288,7 +309,7 @@ pub fn analyze_overview(root: &Path) -> OverviewReport {
 
             // Skeleton analysis for structure and doc coverage
             let skeleton_extractor = SkeletonExtractor::new();
-            let skeleton = skeleton_extractor.extract(&path, &content);
+            let skeleton = skeleton_extractor.extract_tree(&path, &content, &tree, support);
 
             let mut classes = 0;
             let mut methods = 0;
@@ -329,12 +350,13 @@ pub fn analyze_overview(root: &Path) -> OverviewReport {
 
             // Dependencies analysis
             let deps_extractor = DepsExtractor::new();
-            let deps = deps_extractor.extract(&path, &content);
+            let deps = deps_extractor.extract_tree(&path, &content, &tree, support);
 
             let imports = deps.imports.len();
             let modules: Vec<String> = deps.imports.iter().map(|i| i.module.clone()).collect();
 
-            Some(FileStats {
+            FileStats {
+                language,
                 lines,
                 functions,
                 classes,
@@ -347,7 +369,7 @@ pub fn analyze_overview(root: &Path) -> OverviewReport {
                 modules,
                 todos,
                 fixmes,
-            })
+            }
         })
         .collect();
 
@@ -364,8 +386,12 @@ pub fn analyze_overview(root: &Path) -> OverviewReport {
     let mut all_modules: std::collections::HashSet<String> = std::collections::HashSet::new();
     let mut todo_count = 0;
     let mut fixme_count = 0;
+    let mut files_by_language: HashMap<String, usize> = HashMap::new();
 
     for stat in stats {
+        if let Some(language) = stat.language {
+            *files_by_language.entry(language.to_string()).or_insert(0) += 1;
+        }
         total_lines += stat.lines;
         total_functions += stat.functions;
         total_classes += stat.classes;
@@ -407,11 +433,9 @@ pub fn analyze_overview(root: &Path) -> OverviewReport {
         OverviewReport::calculate_health_score(avg_complexity, high_risk_ratio, doc_coverage);
     let grade = OverviewReport::grade_from_score(health_score);
 
-    let lang_counts = files_by_language.into_inner().unwrap();
-
     OverviewReport {
         total_files: files.len(),
-        files_by_language: lang_counts,
+        files_by_language,
         total_lines,
         total_functions,
         total_classes,
@@ -4,16 +4,22 @@ use arborium::tree_sitter::Parser;
 use arborium::GrammarStore;
 use std::sync::Arc;
 
+thread_local! {
+    /// Grammar store shared by every `Parsers` on a thread, so grammars loaded
+    /// for one extractor are reused by the next instead of loaded again.
+    static GRAMMAR_STORE: Arc<GrammarStore> = Arc::new(GrammarStore::new());
+}
+
 /// Collection of tree-sitter parsers using arborium's grammar store.
 pub struct Parsers {
     store: Arc<GrammarStore>,
 }
 
 impl Parsers {
-    /// Create new parser collection with arborium's grammar store.
+    /// Create new parser collection backed by this thread's grammar store.
     pub fn new() -> Self {
         Self {
-            store: Arc::new(GrammarStore::new()),
+            store: GRAMMAR_STORE.with(Arc::clone),
         }
     }
 
@@ -1,9 +1,11 @@
 use ignore::WalkBuilder;
 use nucleo_matcher::pattern::{CaseMatching, Normalization, Pattern};
 use nucleo_matcher::{Config, Matcher};
+use rayon::prelude::*;
 use std::path::Path;
 
 use crate::index::FileIndex;
+use crate::paths::walk_entry_is_dir;
 
 #[derive(Debug, Clone)]
 pub struct PathMatch {
@@ -331,7 +333,7 @@ fn get_paths_for_query(root: &Path, query: &str) -> Vec<(String, bool)> {
             if rel_str.is_empty() || rel_str == ".git" || rel_str.starts_with(".git/") {
                 continue;
             }
-            let is_dir = path.is_dir();
+            let is_dir = walk_entry_is_dir(&entry);
             all_paths.push((rel_str, is_dir));
         }
     }
@@ -361,15 +363,9 @@ fn eq_normalized(a: &str, b: &str) -> bool {
     }
 }
 
-/// Normalize string for comparison (used for filename matching)
-fn normalize_for_match(s: &str) -> String {
-    s.chars().map(normalize_char).collect()
-}
-
 /// Resolve from a pre-loaded list of paths
 fn resolve_from_paths(query: &str, all_paths: &[(String, bool)]) -> Vec<PathMatch> {
     let query_lower = query.to_lowercase();
-    let query_normalized = normalize_for_match(query);
 
     // Try normalized path match (handles exact match too, no allocation)
     for (path, is_dir) in all_paths {
@@ -385,21 +381,21 @@ fn resolve_from_paths(query: &str, all_paths: &[(String, bool)]) -> Vec<PathMatc
     // Try exact filename/dirname match (case-insensitive, _ and - equivalent)
     let mut exact_matches: Vec<PathMatch> = Vec::new();
     for (path, is_dir) in all_paths {
-        let name = Path::new(path)
+        let p = Path::new(path);
+        let name = p
             .file_name()
             .map(|n| n.to_string_lossy().to_lowercase())
             .unwrap_or_default();
-        let stem = Path::new(path)
+        let stem = p
             .file_stem()
             .map(|n| n.to_string_lossy().to_lowercase())
             .unwrap_or_default();
-        let name_normalized = normalize_for_match(&name);
-        let stem_normalized = normalize_for_match(&stem);
 
+        // Normalized comparison walks both strings in place, no copies per path
         if name == query_lower
             || stem == query_lower
-            || name_normalized == query_normalized
-            || stem_normalized == query_normalized
+            || eq_normalized(&name, query)
+            || eq_normalized(&stem, query)
         {
             exact_matches.push(PathMatch {
                 path: path.clone(),
@@ -413,30 +409,44 @@ fn resolve_from_paths(query: &str, all_paths: &[(String, bool)]) -> Vec<PathMatc
         return exact_matches;
     }
 
-    // Fuzzy match using nucleo
-    let mut matcher = Matcher::new(Config::DEFAULT);
+    // Fuzzy match using nucleo, scoring candidates in parallel. Each thread
+    // keeps its own matcher and scratch space for non-ASCII paths.
     let pattern = Pattern::parse(query, CaseMatching::Ignore, Normalization::Smart);
 
-    let mut fuzzy_matches: Vec<PathMatch> = Vec::new();
-
-    for (path, is_dir) in all_paths {
-        let mut buf = Vec::new();
-        if let Some(score) =
-            pattern.score(nucleo_matcher::Utf32Str::new(path, &mut buf), &mut matcher)
-        {
-            fuzzy_matches.push(PathMatch {
+    // Score by index so only the paths that make the cut get cloned
+    let mut scored: Vec<(u32, usize)> = all_paths
+        .par_iter()
+        .enumerate()
+        .map_init(
+            || (Matcher::new(Config::DEFAULT), Vec::new()),
+            |(matcher, buf), (i, (path, _))| {
+                pattern
+                    .score(nucleo_matcher::Utf32Str::new(path, buf), matcher)
+                    .map(|score| (score, i))
+            },
+        )
+        .flatten()
+        .collect();
+
+    // Top 10 by score descending, ties in walk order
+    let rank = |&(score, i): &(u32, usize)| (std::cmp::Reverse(score), i);
+    if scored.len() > 10 {
+        scored.select_nth_unstable_by_key(10, rank);
+        scored.truncate(10);
+    }
+    scored.sort_unstable_by_key(rank);
+
+    scored
+        .into_iter()
+        .map(|(score, i)| {
+            let (path, is_dir) = &all_paths[i];
+            PathMatch {
                 path: path.clone(),
                 kind: if *is_dir { "directory" } else { "file" }.to_string(),
                 score,
-            });
-        }
-    }
-
-    // Sort by score descending, take top 10
-    fuzzy_matches.sort_by(|a, b| b.score.cmp(&a.score));
-    fuzzy_matches.truncate(10);
-
-    fuzzy_matches
+            }
+        })
+        .collect()
 }
 
 #[cfg(test)]
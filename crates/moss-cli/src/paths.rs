@@ -5,6 +5,15 @@
 
 use std::path::{Path, PathBuf};
 
+/// Whether a walked entry is a directory, following symlinks as `metadata()` does.
+/// Uses the walker's cached file type, so only symlinks cost a stat.
+pub fn walk_entry_is_dir(entry: &ignore::DirEntry) -> bool {
+    if entry.path_is_symlink() {
+        return entry.path().is_dir();
+    }
+    entry.file_type().is_some_and(|t| t.is_dir())
+}
+
 /// Get the moss data directory for a project.
 ///
 /// Resolution order:
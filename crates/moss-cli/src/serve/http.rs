@@ -3,7 +3,8 @@
 //! Exposes moss functionality over HTTP for integration with other tools.
 
 use crate::index::FileIndex;
-use crate::skeleton::SkeletonExtractor;
+use crate::skeleton::extract_file_cached;
+use crate::symbols::read_line_range;
 use axum::{
     extract::{Path, Query, State},
     http::StatusCode,
@@ -215,11 +216,7 @@ async fn get_file(
         return Err(StatusCode::NOT_FOUND);
     }
 
-    let content =
-        std::fs::read_to_string(&file_path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
-
-    let extractor = SkeletonExtractor::new();
-    let result = extractor.extract(&file_path, &content);
+    let result = extract_file_cached(&file_path).ok_or(StatusCode::INTERNAL_SERVER_ERROR)?;
 
     let symbols: Vec<SymbolInfo> = result
         .symbols
@@ -355,12 +352,8 @@ async fn get_symbol(
     // Return the first match with its source code
     let (file, _kind, start, end) = &matches[0];
     let abs_path = state.root.join(file);
-    let content =
-        std::fs::read_to_string(&abs_path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
-    let lines: Vec<&str> = content.lines().collect();
-    let start_idx = (*start).saturating_sub(1);
-    let end_idx = (*end).min(lines.len());
-    let source = lines[start_idx..end_idx].join("\n");
+    let source =
+        read_line_range(&abs_path, *start, *end).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
     Ok(Json(SymbolDetailResponse {
         name,
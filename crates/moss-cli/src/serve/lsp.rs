@@ -3,7 +3,7 @@
 //! Provides IDE integration with document symbols, workspace symbols, and hover.
 
 use crate::index::FileIndex;
-use crate::skeleton::SkeletonExtractor;
+use crate::skeleton::extract_file_cached;
 use std::path::PathBuf;
 use std::sync::Mutex;
 use tower_lsp::jsonrpc::Result;
@@ -112,16 +112,12 @@ impl LanguageServer for MossBackend {
             Err(_) => return Ok(None),
         };
 
-        // Read file content
-        let content = match std::fs::read_to_string(&file_path) {
-            Ok(c) => c,
-            Err(_) => return Ok(None),
+        // Extract symbols (cached while the file is unchanged)
+        let result = match extract_file_cached(&file_path) {
+            Some(r) => r,
+            None => return Ok(None),
         };
 
-        // Extract symbols using skeleton extractor
-        let extractor = SkeletonExtractor::new();
-        let result = extractor.extract(&file_path, &content);
-
         // Convert to LSP document symbols (nested structure)
         fn to_document_symbol(sym: &crate::skeleton::SkeletonSymbol) -> DocumentSymbol {
             let range = Range {
@@ -227,16 +223,12 @@ impl LanguageServer for MossBackend {
             Err(_) => return Ok(None),
         };
 
-        // Read file content
-        let content = match std::fs::read_to_string(&file_path) {
-            Ok(c) => c,
-            Err(_) => return Ok(None),
+        // Extract symbols (cached while the file is unchanged)
+        let result = match extract_file_cached(&file_path) {
+            Some(r) => r,
+            None => return Ok(None),
         };
 
-        // Extract symbols
-        let extractor = SkeletonExtractor::new();
-        let result = extractor.extract(&file_path, &content);
-
         // Find symbol at position (1-indexed line)
         let line = position.line as usize + 1;
 
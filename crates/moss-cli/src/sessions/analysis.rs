@@ -1,8 +1,11 @@
 //! Common analysis types shared across all log formats.
 
+use regex::RegexSet;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::fmt::Write;
 use std::path::PathBuf;
+use std::sync::OnceLock;
 
 /// Statistics for a single tool.
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
@@ -113,66 +116,63 @@ impl SessionAnalysis {
     }
 
     pub fn overall_success_rate(&self) -> f64 {
-        let total = self.total_tool_calls();
-        if total == 0 {
-            0.0
-        } else {
-            (total - self.total_errors()) as f64 / total as f64
-        }
+        tool_totals(self.tool_stats.values()).success_rate()
     }
 
     /// Format as markdown report.
     pub fn to_markdown(&self) -> String {
-        let mut lines = vec![
-            "# Session Analysis".to_string(),
-            String::new(),
-            "## Summary".to_string(),
-            String::new(),
-            format!("- **Format**: {}", self.format),
-            format!("- **Tool calls**: {}", self.total_tool_calls()),
-            format!(
-                "- **Success rate**: {:.1}%",
-                self.overall_success_rate() * 100.0
-            ),
-            format!("- **Total turns**: {}", self.total_turns),
-            format!(
-                "- **Parallel opportunities**: {}",
-                self.parallel_opportunities
-            ),
-            String::new(),
-        ];
+        // Materialize tool stats once for both the totals and the usage table
+        let mut tools: Vec<&ToolStats> = self.tool_stats.values().collect();
+        let totals = tool_totals(tools.iter().copied());
+
+        // Fixed-shape summary is rendered from one template as a single block
+        let mut lines = vec![format!(
+            "# Session Analysis\n\n\
+             ## Summary\n\n\
+             - **Format**: {}\n\
+             - **Tool calls**: {}\n\
+             - **Success rate**: {:.1}%\n\
+             - **Total turns**: {}\n\
+             - **Parallel opportunities**: {}\n",
+            self.format,
+            totals.calls,
+            totals.success_rate() * 100.0,
+            self.total_turns,
+            self.parallel_opportunities
+        )];
 
         // Message types
         if !self.message_counts.is_empty() {
-            lines.push("## Message Types".to_string());
-            lines.push(String::new());
-            lines.push("| Type | Count |".to_string());
-            lines.push("|------|-------|".to_string());
+            let mut table = String::from("## Message Types\n\n| Type | Count |\n|------|-------|");
             let mut counts: Vec<_> = self.message_counts.iter().collect();
             counts.sort_by(|a, b| b.1.cmp(a.1));
             for (msg_type, count) in counts {
-                lines.push(format!("| {} | {} |", msg_type, count));
+                write!(table, "\n| {} | {} |", msg_type, count).unwrap();
             }
+            lines.push(table);
             lines.push(String::new());
         }
 
         // Tool usage
-        if !self.tool_stats.is_empty() {
-            lines.push("## Tool Usage".to_string());
-            lines.push(String::new());
-            lines.push("| Tool | Calls | Errors | Success Rate |".to_string());
-            lines.push("|------|-------|--------|--------------|".to_string());
-            let mut tools: Vec<_> = self.tool_stats.values().collect();
+        if !tools.is_empty() {
+            let mut table = String::from(
+                "## Tool Usage\n\n\
+                 | Tool | Calls | Errors | Success Rate |\n\
+                 |------|-------|--------|--------------|",
+            );
             tools.sort_by(|a, b| b.calls.cmp(&a.calls));
             for tool in tools {
-                lines.push(format!(
-                    "| {} | {} | {} | {:.0}% |",
+                write!(
+                    table,
+                    "\n| {} | {} | {} | {:.0}% |",
                     tool.name,
                     tool.calls,
                     tool.errors,
                     tool.success_rate() * 100.0
-                ));
+                )
+                .unwrap();
             }
+            lines.push(table);
             lines.push(String::new());
         }
 
@@ -198,15 +198,19 @@ impl SessionAnalysis {
 
         // Token hotspots
         if !self.file_tokens.is_empty() {
-            lines.push("## Token Hotspots".to_string());
-            lines.push(String::new());
-            lines.push("| Path | Tokens |".to_string());
-            lines.push("|------|--------|".to_string());
+            let mut table =
+                String::from("## Token Hotspots\n\n| Path | Tokens |\n|------|--------|");
             let mut paths: Vec<_> = self.file_tokens.iter().collect();
+            // Select the top 10 in O(n), then sort only those
+            if paths.len() > 10 {
+                paths.select_nth_unstable_by(9, |a, b| b.1.cmp(a.1));
+                paths.truncate(10);
+            }
             paths.sort_by(|a, b| b.1.cmp(a.1));
-            for (path, tokens) in paths.iter().take(10) {
-                lines.push(format!("| {} | {} |", path, tokens));
+            for (path, tokens) in paths {
+                write!(table, "\n| {} | {} |", path, tokens).unwrap();
             }
+            lines.push(table);
             lines.push(String::new());
         }
 
@@ -227,24 +231,45 @@ impl SessionAnalysis {
     }
 }
 
+/// Sum calls and errors across tools in a single traversal.
+fn tool_totals<'a>(tools: impl IntoIterator<Item = &'a ToolStats>) -> ToolStats {
+    let mut totals = ToolStats::default();
+    for tool in tools {
+        totals.calls += tool.calls;
+        totals.errors += tool.errors;
+    }
+    totals
+}
+
+/// Error keywords in priority order, with the category each selects.
+const ERROR_CATEGORIES: [(&str, &str); 6] = [
+    ("exit code", "Command failure"),
+    ("not found", "File not found"),
+    ("permission", "Permission error"),
+    ("timeout", "Timeout"),
+    ("syntax", "Syntax error"),
+    ("import", "Import error"),
+];
+
+/// Case-insensitive matcher for all `ERROR_CATEGORIES` keywords at once.
+static ERROR_KEYWORDS: OnceLock<RegexSet> = OnceLock::new();
+
 /// Categorize an error by its content.
 pub fn categorize_error(error_text: &str) -> &'static str {
-    let text = error_text.to_lowercase();
-    if text.contains("exit code") {
-        "Command failure"
-    } else if text.contains("not found") {
-        "File not found"
-    } else if text.contains("permission") {
-        "Permission error"
-    } else if text.contains("timeout") {
-        "Timeout"
-    } else if text.contains("syntax") {
-        "Syntax error"
-    } else if text.contains("import") {
-        "Import error"
-    } else {
-        "Other"
-    }
+    let keywords = ERROR_KEYWORDS.get_or_init(|| {
+        RegexSet::new(
+            ERROR_CATEGORIES
+                .iter()
+                .map(|(keyword, _)| format!("(?i){}", regex::escape(keyword))),
+        )
+        .unwrap()
+    });
+    // One scan over the text; the lowest matching index has priority
+    keywords
+        .matches(error_text)
+        .iter()
+        .next()
+        .map_or("Other", |i| ERROR_CATEGORIES[i].1)
 }
 
 /// Normalize a file path for aggregation.
@@ -1,14 +1,21 @@
 //! Claude Code JSONL format parser.
 
-use super::{peek_lines, LogFormat};
+use super::{entry_or_insert_with, peek_lines, LogFormat, LOG_READ_BUFFER_SIZE};
 use crate::sessions::{
     categorize_error, normalize_path, ErrorPattern, SessionAnalysis, TokenStats, ToolStats,
 };
+use regex::Regex;
 use serde_json::Value;
 use std::collections::HashMap;
 use std::fs::File;
 use std::io::{BufRead, BufReader};
 use std::path::Path;
+use std::sync::OnceLock;
+
+/// `moss view <path>` / `uv run moss analyze <path>` invocations in Bash commands.
+static MOSS_COMMAND_RE: OnceLock<Regex> = OnceLock::new();
+/// Symbol paths: a file extension followed by `/` (e.g. `src/foo.rs/Bar`).
+static SYMBOL_PATH_RE: OnceLock<Regex> = OnceLock::new();
 
 /// Claude Code session log format (JSONL).
 pub struct ClaudeCodeFormat;
@@ -44,157 +51,166 @@ impl LogFormat for ClaudeCodeFormat {
 
     fn analyze(&self, path: &Path) -> Result<SessionAnalysis, String> {
         let file = File::open(path).map_err(|e| e.to_string())?;
-        let reader = BufReader::new(file);
+        let mut reader = BufReader::with_capacity(LOG_READ_BUFFER_SIZE, file);
 
         let mut analysis = SessionAnalysis::new(path.to_path_buf(), self.name());
-        let mut entries: Vec<Value> = Vec::new();
-
-        // Parse all JSONL entries
-        for line in reader.lines() {
-            let line = line.map_err(|e| e.to_string())?;
-            if line.trim().is_empty() {
-                continue;
+        let mut scan = SessionScan::default();
+
+        // Parse JSONL entries straight from bytes, reusing one line buffer
+        // (no per-line String allocation or separate UTF-8 validation pass).
+        // Each entry is scanned and dropped; the log is never held in memory.
+        let mut line = Vec::new();
+        loop {
+            line.clear();
+            if reader
+                .read_until(b'\n', &mut line)
+                .map_err(|e| e.to_string())?
+                == 0
+            {
+                break;
             }
-            if let Ok(entry) = serde_json::from_str::<Value>(&line) {
-                entries.push(entry);
+            if line.iter().all(u8::is_ascii_whitespace) {
+                continue;
             }
-        }
-
-        // Count message types
-        for entry in &entries {
-            if let Some(msg_type) = entry.get("type").and_then(|v| v.as_str()) {
-                *analysis
-                    .message_counts
-                    .entry(msg_type.to_string())
-                    .or_insert(0) += 1;
+            if let Ok(entry) = serde_json::from_slice::<Value>(&line) {
+                scan.add(&entry);
             }
         }
 
-        // Analyze tools
-        analysis.tool_stats = analyze_tools(&entries);
+        scan.finish(&mut analysis);
 
-        // Analyze tokens
-        analysis.token_stats = analyze_tokens(&entries);
-
-        // Find error patterns
-        analysis.error_patterns = find_error_patterns(&entries);
+        Ok(analysis)
+    }
+}
 
-        // Analyze file token usage
-        analysis.file_tokens = analyze_file_tokens(&entries);
+/// Accumulates every statistic in one walk over the log entries, so each
+/// entry's `message.content` is fetched and iterated once.
+#[derive(Default)]
+struct SessionScan {
+    message_counts: HashMap<String, usize>,
+    tool_stats: HashMap<String, ToolStats>,
+    /// Per-request accumulators, one per turn (streaming updates repeat
+    /// a request ID)
+    requests: HashMap<String, RequestData>,
+    error_patterns: HashMap<&'static str, ErrorPattern>,
+    /// Turns with a single tool call (parallelization opportunity)
+    single_tool_turns: usize,
+}
 
-        // Count turns and parallel opportunities
-        analysis.total_turns = count_turns(&entries);
-        analysis.parallel_opportunities = find_parallel_opportunities(&entries);
+impl SessionScan {
+    fn add(&mut self, entry: &Value) {
+        let Some(msg_type) = entry.get("type").and_then(|v| v.as_str()) else {
+            return;
+        };
+        *entry_or_insert_with(&mut self.message_counts, msg_type, Default::default) += 1;
 
-        Ok(analysis)
+        match msg_type {
+            "assistant" => self.add_assistant(entry),
+            "user" => self.add_user(entry),
+            _ => {}
+        }
     }
-}
 
-fn analyze_tools(entries: &[Value]) -> HashMap<String, ToolStats> {
-    let mut stats: HashMap<String, ToolStats> = HashMap::new();
+    fn add_assistant(&mut self, entry: &Value) {
+        let request_id = entry
+            .get("requestId")
+            .and_then(|v| v.as_str())
+            .unwrap_or("unknown");
+        let data = entry_or_insert_with(&mut self.requests, request_id, Default::default);
 
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) != Some("assistant") {
-            continue;
+        // Take max values per request (streaming updates)
+        let message = entry.get("message");
+        if let Some(usage) = message.and_then(|m| m.get("usage")) {
+            let get = |key: &str| usage.get(key).and_then(|v| v.as_u64()).unwrap_or(0);
+            data.input = data.input.max(get("input_tokens"));
+            data.output_tokens = data.output_tokens.max(get("output_tokens"));
+            data.cache_read = data.cache_read.max(get("cache_read_input_tokens"));
+            data.cache_create = data.cache_create.max(get("cache_creation_input_tokens"));
         }
 
-        let Some(content) = entry
-            .get("message")
+        let Some(content) = message
             .and_then(|m| m.get("content"))
             .and_then(|c| c.as_array())
         else {
-            continue;
+            return;
         };
 
+        let mut tool_uses = 0;
         for block in content {
-            if block.get("type").and_then(|v| v.as_str()) == Some("tool_use") {
-                if let Some(tool_name) = block.get("name").and_then(|v| v.as_str()) {
-                    let stat = stats
-                        .entry(tool_name.to_string())
-                        .or_insert_with(|| ToolStats::new(tool_name));
-                    stat.calls += 1;
-                }
+            if block.get("type").and_then(|v| v.as_str()) != Some("tool_use") {
+                continue;
+            }
+            tool_uses += 1;
+
+            let tool_name = block.get("name").and_then(|v| v.as_str());
+            if let Some(tool_name) = tool_name {
+                entry_or_insert_with(&mut self.tool_stats, tool_name, || {
+                    ToolStats::new(tool_name)
+                })
+                .calls += 1;
             }
+
+            collect_tool_paths(tool_name.unwrap_or(""), block.get("input"), &mut data.paths);
         }
-    }
 
-    // Count errors from tool results in user messages
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) != Some("user") {
-            continue;
+        if tool_uses == 1 {
+            self.single_tool_turns += 1;
         }
+    }
 
+    fn add_user(&mut self, entry: &Value) {
+        // Check user messages for tool_result with is_error
         let Some(content) = entry
             .get("message")
             .and_then(|m| m.get("content"))
             .and_then(|c| c.as_array())
         else {
-            continue;
+            return;
         };
 
         for block in content {
-            if block.get("type").and_then(|v| v.as_str()) == Some("tool_result") {
-                if block.get("is_error").and_then(|v| v.as_bool()) == Some(true) {
-                    // Tool errors are hard to attribute without tracking tool_use_id
-                    // For now, we count them in error patterns
+            if block.get("type").and_then(|v| v.as_str()) == Some("tool_result")
+                && block.get("is_error").and_then(|v| v.as_bool()) == Some(true)
+            {
+                // First 100 chars, borrowed; only stored examples are copied
+                let text = block.get("content").and_then(|v| v.as_str()).unwrap_or("");
+                let error_text = match text.char_indices().nth(100) {
+                    Some((end, _)) => &text[..end],
+                    None => text,
+                };
+
+                let category = categorize_error(error_text);
+                let pattern = self
+                    .error_patterns
+                    .entry(category)
+                    .or_insert_with(|| ErrorPattern::new(category));
+                pattern.count += 1;
+                if pattern.examples.len() < 3 {
+                    pattern.examples.push(error_text.to_string());
                 }
             }
         }
     }
 
-    stats
+    fn finish(self, analysis: &mut SessionAnalysis) {
+        analysis.message_counts = self.message_counts;
+        analysis.tool_stats = self.tool_stats;
+        analysis.token_stats = aggregate_tokens(&self.requests);
+        analysis.error_patterns = rank_error_patterns(self.error_patterns);
+        analysis.file_tokens = distribute_file_tokens(&self.requests);
+        analysis.total_turns = self.requests.len();
+        analysis.parallel_opportunities = self.single_tool_turns;
+    }
 }
 
-fn analyze_tokens(entries: &[Value]) -> TokenStats {
+fn aggregate_tokens(requests: &HashMap<String, RequestData>) -> TokenStats {
     let mut stats = TokenStats::default();
-    let mut request_data: HashMap<String, TokenData> = HashMap::new();
-
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) != Some("assistant") {
-            continue;
-        }
-
-        let Some(usage) = entry.get("message").and_then(|m| m.get("usage")) else {
-            continue;
-        };
 
-        let request_id = entry
-            .get("requestId")
-            .and_then(|v| v.as_str())
-            .unwrap_or("unknown")
-            .to_string();
-
-        let input = usage
-            .get("input_tokens")
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-        let output = usage
-            .get("output_tokens")
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-        let cache_read = usage
-            .get("cache_read_input_tokens")
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-        let cache_create = usage
-            .get("cache_creation_input_tokens")
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-
-        // Take max values per request (streaming updates)
-        let data = request_data.entry(request_id).or_default();
-        data.input = data.input.max(input);
-        data.output = data.output.max(output);
-        data.cache_read = data.cache_read.max(cache_read);
-        data.cache_create = data.cache_create.max(cache_create);
-    }
-
-    // Aggregate
-    for data in request_data.values() {
+    for data in requests.values() {
         if data.input > 0 || data.cache_read > 0 {
             stats.api_calls += 1;
             stats.total_input += data.input;
-            stats.total_output += data.output;
+            stats.total_output += data.output_tokens;
             stats.cache_read += data.cache_read;
             stats.cache_create += data.cache_create;
 
@@ -206,145 +222,56 @@ fn analyze_tokens(entries: &[Value]) -> TokenStats {
     stats
 }
 
-#[derive(Default)]
-struct TokenData {
-    input: u64,
-    output: u64,
-    cache_read: u64,
-    cache_create: u64,
-}
-
-fn find_error_patterns(entries: &[Value]) -> Vec<ErrorPattern> {
-    let mut categories: HashMap<&str, Vec<String>> = HashMap::new();
-
-    for entry in entries {
-        // Check user messages for tool_result with is_error
-        if entry.get("type").and_then(|v| v.as_str()) != Some("user") {
-            continue;
-        }
-
-        let Some(content) = entry
-            .get("message")
-            .and_then(|m| m.get("content"))
-            .and_then(|c| c.as_array())
-        else {
-            continue;
-        };
-
-        for block in content {
-            if block.get("type").and_then(|v| v.as_str()) == Some("tool_result")
-                && block.get("is_error").and_then(|v| v.as_bool()) == Some(true)
-            {
-                let error_text = block
-                    .get("content")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("")
-                    .chars()
-                    .take(100)
-                    .collect::<String>();
-
-                let category = categorize_error(&error_text);
-                categories.entry(category).or_default().push(error_text);
-            }
-        }
-    }
-
-    let mut patterns: Vec<ErrorPattern> = categories
-        .into_iter()
-        .map(|(category, examples)| {
-            let mut pattern = ErrorPattern::new(category);
-            pattern.count = examples.len();
-            pattern.examples = examples.into_iter().take(3).collect();
-            pattern
-        })
-        .collect();
-
+fn rank_error_patterns(patterns: HashMap<&'static str, ErrorPattern>) -> Vec<ErrorPattern> {
+    let mut patterns: Vec<ErrorPattern> = patterns.into_values().collect();
     patterns.sort_by(|a, b| b.count.cmp(&a.count));
     patterns
 }
 
-fn analyze_file_tokens(entries: &[Value]) -> HashMap<String, u64> {
-    let mut file_tokens: HashMap<String, u64> = HashMap::new();
-    let mut requests: HashMap<String, RequestData> = HashMap::new();
+/// Extract the file/symbol paths a tool call touched.
+fn collect_tool_paths(tool_name: &str, input: Option<&Value>, paths: &mut Vec<String>) {
+    // Extract file_path from Read, Edit, Write
+    if let Some(fp) = input
+        .and_then(|i| i.get("file_path"))
+        .and_then(|v| v.as_str())
+    {
+        paths.push(fp.to_string());
+    }
 
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) != Some("assistant") {
-            continue;
-        }
+    // Extract path from Grep
+    if let Some(p) = input.and_then(|i| i.get("path")).and_then(|v| v.as_str()) {
+        paths.push(p.to_string());
+    }
 
-        let request_id = entry
-            .get("requestId")
+    // Extract from Bash commands (moss view/analyze)
+    if tool_name == "Bash" {
+        if let Some(cmd) = input
+            .and_then(|i| i.get("command"))
             .and_then(|v| v.as_str())
-            .unwrap_or("unknown")
-            .to_string();
-
-        let output_tokens = entry
-            .get("message")
-            .and_then(|m| m.get("usage"))
-            .and_then(|u| u.get("output_tokens"))
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-
-        let data = requests.entry(request_id).or_default();
-        data.output_tokens = data.output_tokens.max(output_tokens);
-
-        // Extract file paths from tool calls
-        let Some(content) = entry
-            .get("message")
-            .and_then(|m| m.get("content"))
-            .and_then(|c| c.as_array())
-        else {
-            continue;
-        };
-
-        for block in content {
-            if block.get("type").and_then(|v| v.as_str()) != Some("tool_use") {
-                continue;
-            }
-
-            let tool_name = block.get("name").and_then(|v| v.as_str()).unwrap_or("");
-            let input = block.get("input");
-
-            // Extract file_path from Read, Edit, Write
-            if let Some(fp) = input
-                .and_then(|i| i.get("file_path"))
-                .and_then(|v| v.as_str())
-            {
-                data.paths.push(fp.to_string());
-            }
-
-            // Extract path from Grep
-            if let Some(p) = input.and_then(|i| i.get("path")).and_then(|v| v.as_str()) {
-                data.paths.push(p.to_string());
-            }
-
-            // Extract from Bash commands (moss view/analyze)
-            if tool_name == "Bash" {
-                if let Some(cmd) = input
-                    .and_then(|i| i.get("command"))
-                    .and_then(|v| v.as_str())
-                {
-                    data.paths.extend(extract_symbol_paths_from_bash(cmd));
-                }
-            }
+        {
+            paths.extend(extract_symbol_paths_from_bash(cmd));
+        }
+    }
 
-            // Extract directory from Glob pattern
-            if tool_name == "Glob" {
-                if let Some(pattern) = input
-                    .and_then(|i| i.get("pattern"))
-                    .and_then(|v| v.as_str())
-                {
-                    if let Some(dir) = pattern.rsplit_once('/') {
-                        if !dir.0.starts_with('*') {
-                            data.paths.push(dir.0.to_string());
-                        }
-                    }
+    // Extract directory from Glob pattern
+    if tool_name == "Glob" {
+        if let Some(pattern) = input
+            .and_then(|i| i.get("pattern"))
+            .and_then(|v| v.as_str())
+        {
+            if let Some(dir) = pattern.rsplit_once('/') {
+                if !dir.0.starts_with('*') {
+                    paths.push(dir.0.to_string());
                 }
             }
         }
     }
+}
+
+/// Distribute each request's output tokens evenly over the paths it touched.
+fn distribute_file_tokens(requests: &HashMap<String, RequestData>) -> HashMap<String, u64> {
+    let mut file_tokens: HashMap<String, u64> = HashMap::new();
 
-    // Distribute tokens to paths
     for data in requests.values() {
         if data.paths.is_empty() || data.output_tokens == 0 {
             continue;
@@ -359,9 +286,14 @@ fn analyze_file_tokens(entries: &[Value]) -> HashMap<String, u64> {
     file_tokens
 }
 
+/// Everything tracked for one API request.
 #[derive(Default)]
 struct RequestData {
+    input: u64,
     output_tokens: u64,
+    cache_read: u64,
+    cache_create: u64,
+    /// File/symbol paths touched by the request's tool calls
     paths: Vec<String>,
 }
 
@@ -369,61 +301,19 @@ fn extract_symbol_paths_from_bash(command: &str) -> Vec<String> {
     let mut paths = Vec::new();
 
     // Match: moss view <path> or uv run moss view <path>
-    let re = regex::Regex::new(r"(?:uv run )?moss (?:view|analyze)\s+([^\s]+)").unwrap();
+    let re = MOSS_COMMAND_RE
+        .get_or_init(|| Regex::new(r"(?:uv run )?moss (?:view|analyze)\s+([^\s]+)").unwrap());
+    let symbol_path_re = SYMBOL_PATH_RE.get_or_init(|| Regex::new(r"\.\w+/\w").unwrap());
     for cap in re.captures_iter(command) {
         let path = &cap[1];
         if path.starts_with('-') {
             continue;
         }
         // Check if it looks like a symbol path (has / after file extension)
-        if regex::Regex::new(r"\.\w+/\w").unwrap().is_match(path) {
+        if symbol_path_re.is_match(path) {
             paths.push(path.to_string());
         }
     }
 
     paths
 }
-
-fn count_turns(entries: &[Value]) -> usize {
-    let mut seen: std::collections::HashSet<String> = std::collections::HashSet::new();
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) == Some("assistant") {
-            let request_id = entry
-                .get("requestId")
-                .and_then(|v| v.as_str())
-                .unwrap_or("unknown")
-                .to_string();
-            seen.insert(request_id);
-        }
-    }
-    seen.len()
-}
-
-fn find_parallel_opportunities(entries: &[Value]) -> usize {
-    let mut single_tool_turns = 0;
-
-    for entry in entries {
-        if entry.get("type").and_then(|v| v.as_str()) != Some("assistant") {
-            continue;
-        }
-
-        let Some(content) = entry
-            .get("message")
-            .and_then(|m| m.get("content"))
-            .and_then(|c| c.as_array())
-        else {
-            continue;
-        };
-
-        let tool_uses: Vec<_> = content
-            .iter()
-            .filter(|b| b.get("type").and_then(|v| v.as_str()) == Some("tool_use"))
-            .collect();
-
-        if tool_uses.len() == 1 {
-            single_tool_turns += 1;
-        }
-    }
-
-    single_tool_turns
-}
@@ -1,6 +1,6 @@
 //! Gemini CLI JSON format parser.
 
-use super::{read_file, LogFormat};
+use super::{entry_or_insert_with, read_file, LogFormat};
 use crate::sessions::{normalize_path, SessionAnalysis, TokenStats, ToolStats};
 use serde_json::Value;
 use std::collections::HashMap;
@@ -53,133 +53,78 @@ impl LogFormat for GeminiCliFormat {
         let messages = data
             .get("messages")
             .and_then(|m| m.as_array())
-            .cloned()
-            .unwrap_or_default();
-
-        // Count message types
-        for msg in &messages {
-            if let Some(msg_type) = msg.get("type").and_then(|v| v.as_str()) {
-                *analysis
-                    .message_counts
-                    .entry(msg_type.to_string())
-                    .or_insert(0) += 1;
-            }
-        }
+            .map_or(&[][..], |m| m.as_slice());
 
-        // Analyze tools
-        analysis.tool_stats = analyze_tools(&messages);
+        // Single pass: each message's type is checked once
+        for msg in messages {
+            let Some(msg_type) = msg.get("type").and_then(|v| v.as_str()) else {
+                continue;
+            };
+            *entry_or_insert_with(&mut analysis.message_counts, msg_type, Default::default) += 1;
 
-        // Analyze tokens
-        analysis.token_stats = analyze_tokens(&messages);
+            if msg_type != "gemini" {
+                continue;
+            }
+            analysis.total_turns += 1;
 
-        // Analyze file token usage
-        analysis.file_tokens = analyze_file_tokens(&messages);
+            let tool_calls = msg
+                .get("toolCalls")
+                .and_then(|t| t.as_array())
+                .map_or(&[][..], |t| t.as_slice());
+            add_tool_calls(&mut analysis.tool_stats, tool_calls);
 
-        // Count turns
-        analysis.total_turns = messages
-            .iter()
-            .filter(|m| m.get("type").and_then(|t| t.as_str()) == Some("gemini"))
-            .count();
+            if let Some(tokens) = msg.get("tokens") {
+                add_tokens(&mut analysis.token_stats, tokens);
+                add_file_tokens(&mut analysis.file_tokens, tokens, tool_calls);
+            }
+        }
 
         Ok(analysis)
     }
 }
 
-fn analyze_tools(messages: &[Value]) -> HashMap<String, ToolStats> {
-    let mut stats: HashMap<String, ToolStats> = HashMap::new();
-
-    for msg in messages {
-        if msg.get("type").and_then(|t| t.as_str()) != Some("gemini") {
-            continue;
-        }
-
-        let Some(tool_calls) = msg.get("toolCalls").and_then(|t| t.as_array()) else {
-            continue;
-        };
-
-        for tc in tool_calls {
-            let tool_name = tc.get("name").and_then(|n| n.as_str()).unwrap_or("unknown");
+fn add_tool_calls(stats: &mut HashMap<String, ToolStats>, tool_calls: &[Value]) {
+    for tc in tool_calls {
+        let tool_name = tc.get("name").and_then(|n| n.as_str()).unwrap_or("unknown");
 
-            let stat = stats
-                .entry(tool_name.to_string())
-                .or_insert_with(|| ToolStats::new(tool_name));
-            stat.calls += 1;
+        let stat = entry_or_insert_with(stats, tool_name, || ToolStats::new(tool_name));
+        stat.calls += 1;
 
-            // Check for errors
-            if tc.get("status").and_then(|s| s.as_str()) == Some("error") {
-                stat.errors += 1;
-            }
+        // Check for errors
+        if tc.get("status").and_then(|s| s.as_str()) == Some("error") {
+            stat.errors += 1;
         }
     }
-
-    stats
 }
 
-fn analyze_tokens(messages: &[Value]) -> TokenStats {
-    let mut stats = TokenStats::default();
-
-    for msg in messages {
-        if msg.get("type").and_then(|t| t.as_str()) != Some("gemini") {
-            continue;
-        }
-
-        let Some(tokens) = msg.get("tokens") else {
-            continue;
-        };
+fn add_tokens(stats: &mut TokenStats, tokens: &Value) {
+    let input = tokens.get("input").and_then(|v| v.as_u64()).unwrap_or(0);
+    let cached = tokens.get("cached").and_then(|v| v.as_u64()).unwrap_or(0);
 
-        stats.api_calls += 1;
-        stats.total_input += tokens.get("input").and_then(|v| v.as_u64()).unwrap_or(0);
-        stats.total_output += tokens.get("output").and_then(|v| v.as_u64()).unwrap_or(0);
-        stats.cache_read += tokens.get("cached").and_then(|v| v.as_u64()).unwrap_or(0);
-
-        let context = tokens.get("input").and_then(|v| v.as_u64()).unwrap_or(0)
-            + tokens.get("cached").and_then(|v| v.as_u64()).unwrap_or(0);
-        stats.update_context(context);
-    }
-
-    stats
+    stats.api_calls += 1;
+    stats.total_input += input;
+    stats.total_output += tokens.get("output").and_then(|v| v.as_u64()).unwrap_or(0);
+    stats.cache_read += cached;
+    stats.update_context(input + cached);
 }
 
-fn analyze_file_tokens(messages: &[Value]) -> HashMap<String, u64> {
-    let mut file_tokens: HashMap<String, u64> = HashMap::new();
-
-    for msg in messages {
-        if msg.get("type").and_then(|t| t.as_str()) != Some("gemini") {
-            continue;
-        }
-
-        let output_tokens = msg
-            .get("tokens")
-            .and_then(|t| t.get("output"))
-            .and_then(|v| v.as_u64())
-            .unwrap_or(0);
-
-        if output_tokens == 0 {
-            continue;
-        }
+/// Distribute a message's output tokens evenly over the files its tool calls touched.
+fn add_file_tokens(file_tokens: &mut HashMap<String, u64>, tokens: &Value, tool_calls: &[Value]) {
+    let output_tokens = tokens.get("output").and_then(|v| v.as_u64()).unwrap_or(0);
+    if output_tokens == 0 {
+        return;
+    }
 
-        // Extract files from tool calls
-        let mut files: Vec<String> = Vec::new();
-        if let Some(tool_calls) = msg.get("toolCalls").and_then(|t| t.as_array()) {
-            for tc in tool_calls {
-                if let Some(args) = tc.get("args") {
-                    // read_file, write_file have file_path
-                    if let Some(fp) = args.get("file_path").and_then(|v| v.as_str()) {
-                        files.push(fp.to_string());
-                    }
-                }
-            }
-        }
+    // read_file, write_file have file_path
+    let files: Vec<&str> = tool_calls
+        .iter()
+        .filter_map(|tc| tc.get("args")?.get("file_path")?.as_str())
+        .collect();
 
-        // Distribute tokens to files
-        if !files.is_empty() {
-            let per_file = output_tokens / files.len() as u64;
-            for f in files {
-                let norm = normalize_path(&f);
-                *file_tokens.entry(norm).or_insert(0) += per_file;
-            }
+    if !files.is_empty() {
+        let per_file = output_tokens / files.len() as u64;
+        for f in files {
+            *file_tokens.entry(normalize_path(f)).or_insert(0) += per_file;
         }
     }
-
-    file_tokens
 }
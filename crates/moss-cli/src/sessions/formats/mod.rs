@@ -11,10 +11,15 @@ pub use gemini_cli::GeminiCliFormat;
 pub use moss::MossFormat;
 
 use crate::sessions::SessionAnalysis;
+use std::collections::HashMap;
 use std::fs::File;
 use std::io::{BufRead, BufReader, Read};
 use std::path::Path;
 
+/// Read buffer for streaming JSONL session logs. Logs run to hundreds of
+/// MB; a large buffer keeps read syscalls per line negligible.
+pub(crate) const LOG_READ_BUFFER_SIZE: usize = 1 << 20;
+
 /// Trait for session log format plugins.
 pub trait LogFormat: Send + Sync {
     /// Format identifier (e.g., "claude", "gemini", "moss").
@@ -114,3 +119,16 @@ pub(crate) fn read_file(path: &Path) -> Result<String, String> {
         .map_err(|e| e.to_string())?;
     Ok(content)
 }
+
+/// Helper: `map.entry(key.to_string()).or_insert_with(default)` that only
+/// allocates the owned key on first insertion, not on every repeated lookup.
+pub(crate) fn entry_or_insert_with<'a, V>(
+    map: &'a mut HashMap<String, V>,
+    key: &str,
+    default: impl FnOnce() -> V,
+) -> &'a mut V {
+    if !map.contains_key(key) {
+        map.insert(key.to_string(), default());
+    }
+    map.get_mut(key).unwrap()
+}
@@ -1,6 +1,6 @@
 //! Moss internal session JSON format parser.
 
-use super::{read_file, LogFormat};
+use super::{entry_or_insert_with, read_file, LogFormat};
 use crate::sessions::{SessionAnalysis, TokenStats, ToolStats};
 use serde_json::Value;
 use std::path::Path;
@@ -54,10 +54,9 @@ impl LogFormat for MossFormat {
                     .and_then(|n| n.as_str())
                     .unwrap_or("unknown");
 
-                let stat = analysis
-                    .tool_stats
-                    .entry(tool_name.to_string())
-                    .or_insert_with(|| ToolStats::new(tool_name));
+                let stat = entry_or_insert_with(&mut analysis.tool_stats, tool_name, || {
+                    ToolStats::new(tool_name)
+                });
                 stat.calls += 1;
 
                 if tc.get("error").is_some() {
@@ -5,8 +5,12 @@
 
 use crate::extract::{ExtractOptions, Extractor};
 use crate::tree::{ViewNode, ViewNodeKind};
-use moss_languages::{Symbol as LangSymbol, SymbolKind as LangSymbolKind};
-use std::path::Path;
+use arborium::tree_sitter;
+use moss_languages::{Language, Symbol as LangSymbol, SymbolKind as LangSymbolKind};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex};
+use std::time::SystemTime;
 
 /// A code symbol with its signature
 #[derive(Debug, Clone)]
@@ -172,6 +176,21 @@ impl SkeletonExtractor {
         }
     }
 
+    /// Extract from a tree already parsed with `support`'s grammar.
+    pub fn extract_tree(
+        &self,
+        path: &Path,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> SkeletonResult {
+        let result = self.extractor.extract_tree(path, content, tree, support);
+        SkeletonResult {
+            symbols: result.symbols.iter().map(convert_symbol).collect(),
+            file_path: result.file_path,
+        }
+    }
+
     /// Trait-based extraction (for future use when implementations are complete)
     #[allow(dead_code)]
     pub fn extract_with_support(&self, path: &Path, content: &str) -> Option<SkeletonResult> {
@@ -190,6 +209,55 @@ impl SkeletonExtractor {
     }
 }
 
+/// Skeleton of a file as of a given mtime and size.
+struct CachedSkeleton {
+    modified: SystemTime,
+    len: u64,
+    result: Arc<SkeletonResult>,
+}
+
+/// Per-process skeleton cache for long-running servers (LSP, HTTP).
+static SKELETON_CACHE: Mutex<Option<HashMap<PathBuf, CachedSkeleton>>> = Mutex::new(None);
+
+/// Cached skeletons kept at most; the cache is cleared when a new file would exceed it.
+const SKELETON_CACHE_MAX_ENTRIES: usize = 1024;
+
+/// Read and extract a file's skeleton, reusing the previous result while
+/// the file's mtime and size are unchanged.
+pub fn extract_file_cached(path: &Path) -> Option<Arc<SkeletonResult>> {
+    let meta = std::fs::metadata(path).ok()?;
+    let modified = meta.modified().ok()?;
+    let len = meta.len();
+
+    {
+        let cache = SKELETON_CACHE.lock().unwrap();
+        if let Some(cached) = cache.as_ref().and_then(|c| c.get(path)) {
+            if cached.modified == modified && cached.len == len {
+                return Some(Arc::clone(&cached.result));
+            }
+        }
+    }
+
+    let content = std::fs::read_to_string(path).ok()?;
+    let result = Arc::new(SkeletonExtractor::new().extract(path, &content));
+
+    let mut cache = SKELETON_CACHE.lock().unwrap();
+    let cache = cache.get_or_insert_with(HashMap::new);
+    if cache.len() >= SKELETON_CACHE_MAX_ENTRIES && !cache.contains_key(path) {
+        cache.clear();
+    }
+    cache.insert(
+        path.to_path_buf(),
+        CachedSkeleton {
+            modified,
+            len,
+            result: Arc::clone(&result),
+        },
+    );
+
+    Some(result)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
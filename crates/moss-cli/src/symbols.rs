@@ -5,6 +5,9 @@ use moss_languages::{
     support_for_grammar, support_for_path, Language, Symbol as LangSymbol,
     SymbolKind as LangSymbolKind,
 };
+use std::borrow::Cow;
+use std::fs::File;
+use std::io::{BufRead, BufReader};
 use std::path::Path;
 
 #[derive(Debug, Clone)]
@@ -31,6 +34,19 @@ pub struct Import {
     pub line: usize,
 }
 
+/// Symbols and imports from a single parse of a file.
+#[derive(Debug, Default)]
+pub struct ParsedFile {
+    pub symbols: Vec<Symbol>,
+    pub imports: Vec<Import>,
+}
+
+/// A file's syntax tree and the language it was parsed with.
+struct ParsedTree {
+    lang: &'static dyn Language,
+    tree: tree_sitter::Tree,
+}
+
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 #[allow(dead_code)] // Import variant reserved for import tracking
 pub enum SymbolKind {
@@ -70,6 +86,54 @@ fn convert_symbol_kind(kind: LangSymbolKind) -> SymbolKind {
     }
 }
 
+/// Source of 1-based lines `start_line..=end_line`, joined with `\n` the way
+/// `content.lines()` would give them, without splitting the whole file.
+fn line_range(content: &str, start_line: usize, end_line: usize) -> Cow<'_, str> {
+    let start = start_line.saturating_sub(1);
+    let count = end_line.saturating_sub(start);
+    let mut line_starts = std::iter::once(0).chain(content.match_indices('\n').map(|(i, _)| i + 1));
+    let begin = match line_starts.nth(start) {
+        Some(begin) if count > 0 => begin,
+        _ => return Cow::Borrowed(""),
+    };
+    let source = match line_starts.nth(count - 1) {
+        Some(next) => &content[begin..next - 1],
+        // Range runs to the end of the file, which may end in a newline
+        None => {
+            let rest = &content[begin..];
+            rest.strip_suffix('\n').unwrap_or(rest)
+        }
+    };
+    if source.contains('\r') {
+        // Drop CRLF carriage returns like lines() does
+        Cow::Owned(
+            source
+                .split('\n')
+                .map(|line| line.strip_suffix('\r').unwrap_or(line))
+                .collect::<Vec<_>>()
+                .join("\n"),
+        )
+    } else {
+        Cow::Borrowed(source)
+    }
+}
+
+/// Read 1-based lines `start_line..=end_line` of a file, stopping at the end
+/// of the range instead of loading the whole file.
+pub fn read_line_range(path: &Path, start_line: usize, end_line: usize) -> std::io::Result<String> {
+    let start = start_line.saturating_sub(1);
+    let count = end_line.saturating_sub(start);
+    let lines = BufReader::new(File::open(path)?).lines();
+    let mut source = String::new();
+    for (i, line) in lines.skip(start).take(count).enumerate() {
+        if i > 0 {
+            source.push('\n');
+        }
+        source.push_str(&line?);
+    }
+    Ok(source)
+}
+
 pub struct SymbolParser {
     extractor: Extractor,
     parsers: Parsers, // Keep for import parsing and call graph analysis
@@ -86,23 +150,51 @@ impl SymbolParser {
     }
 
     pub fn parse_file(&self, path: &Path, content: &str) -> Vec<Symbol> {
-        let support = match support_for_path(path) {
-            Some(s) => s,
-            None => return Vec::new(),
+        match self.parse_tree(path, content) {
+            Some(parsed) => self.symbols_in_tree(path, content, &parsed.tree, parsed.lang),
+            None => Vec::new(),
+        }
+    }
+
+    /// Parse a file once and extract both its symbols and its imports.
+    pub fn parse_file_with_imports(&self, path: &Path, content: &str) -> ParsedFile {
+        let Some(ParsedTree { lang, tree }) = self.parse_tree(path, content) else {
+            return ParsedFile::default();
         };
+        ParsedFile {
+            symbols: self.symbols_in_tree(path, content, &tree, lang),
+            imports: self.imports_in_tree(content, &tree, lang),
+        }
+    }
+
+    fn parse_tree(&self, path: &Path, content: &str) -> Option<ParsedTree> {
+        let lang = support_for_path(path)?;
 
-        // Use shared extractor for symbol extraction
-        let result = self.extractor.extract(path, content);
+        // Blank files (empty __init__.py, placeholder modules) have nothing to extract
+        if content.trim().is_empty() {
+            return None;
+        }
 
-        // Parse once for complexity computation
         let tree = self
             .parsers
-            .parse_with_grammar(support.grammar_name(), content);
+            .parse_with_grammar(lang.grammar_name(), content)?;
+        Some(ParsedTree { lang, tree })
+    }
+
+    fn symbols_in_tree(
+        &self,
+        path: &Path,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> Vec<Symbol> {
+        // The same tree serves symbol extraction and complexity computation
+        let result = self.extractor.extract_tree(path, content, tree, support);
 
         // Flatten nested symbols and compute complexity
         let mut symbols = Vec::new();
         for sym in &result.symbols {
-            self.flatten_symbol(sym, None, &mut symbols, content, support, tree.as_ref());
+            self.flatten_symbol(sym, None, &mut symbols, content, support, Some(tree));
         }
         symbols
     }
@@ -197,27 +289,19 @@ impl SymbolParser {
         None
     }
 
-    /// Parse imports from any supported language file using trait-based extraction.
+    /// Extract imports from a parsed tree using trait-based extraction.
     /// Returns a flattened list where each imported name gets its own Import entry.
-    pub fn parse_imports(&self, path: &Path, content: &str) -> Vec<Import> {
-        let support = match support_for_path(path) {
-            Some(s) => s,
-            None => return Vec::new(),
-        };
-
+    fn imports_in_tree(
+        &self,
+        content: &str,
+        tree: &tree_sitter::Tree,
+        support: &dyn Language,
+    ) -> Vec<Import> {
         // Check if this language has import support
         if support.import_kinds().is_empty() {
             return Vec::new();
         }
 
-        let tree = match self
-            .parsers
-            .parse_with_grammar(support.grammar_name(), content)
-        {
-            Some(t) => t,
-            None => return Vec::new(),
-        };
-
         let mut imports = Vec::new();
         let root = tree.root_node();
         let mut cursor = root.walk();
@@ -327,10 +411,7 @@ impl SymbolParser {
         name: &str,
     ) -> Option<String> {
         let symbol = self.find_symbol(path, content, name)?;
-        let lines: Vec<&str> = content.lines().collect();
-        let start = symbol.start_line.saturating_sub(1);
-        let end = symbol.end_line.min(lines.len());
-        Some(lines[start..end].join("\n"))
+        Some(line_range(content, symbol.start_line, symbol.end_line).into_owned())
     }
 
     /// Find callees (functions/methods called) within a symbol
@@ -341,11 +422,7 @@ impl SymbolParser {
             None => return Vec::new(),
         };
 
-        // Extract symbol source
-        let lines: Vec<&str> = content.lines().collect();
-        let start = symbol.start_line.saturating_sub(1);
-        let end = symbol.end_line.min(lines.len());
-        let source = lines[start..end].join("\n");
+        let source = line_range(content, symbol.start_line, symbol.end_line);
 
         let ext = path.extension().and_then(|e| e.to_str()).unwrap_or("");
         match ext {
@@ -426,10 +503,7 @@ impl SymbolParser {
         content: &str,
         symbol: &Symbol,
     ) -> Vec<(String, usize, Option<String>)> {
-        let lines: Vec<&str> = content.lines().collect();
-        let start = symbol.start_line.saturating_sub(1);
-        let end = symbol.end_line.min(lines.len());
-        let source = lines[start..end].join("\n");
+        let source = line_range(content, symbol.start_line, symbol.end_line);
 
         let ext = path.extension().and_then(|e| e.to_str()).unwrap_or("");
         match ext {
@@ -902,4 +976,24 @@ def bar():
         assert!(source.is_some());
         assert!(source.unwrap().contains("return 42"));
     }
+
+    #[test]
+    fn test_line_range() {
+        let content = "a\nb\r\n\nc\n";
+        assert_eq!(line_range(content, 1, 2), "a\nb");
+        assert_eq!(line_range(content, 2, 3), "b\n");
+        assert_eq!(line_range(content, 4, 9), "c");
+        assert_eq!(line_range(content, 5, 9), "");
+        assert_eq!(line_range(content, 3, 2), "");
+    }
+
+    #[test]
+    fn test_read_line_range() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("lines.txt");
+        std::fs::write(&path, "a\nb\r\nc\nd\n").unwrap();
+        assert_eq!(read_line_range(&path, 2, 3).unwrap(), "b\nc");
+        assert_eq!(read_line_range(&path, 4, 9).unwrap(), "d");
+        assert_eq!(read_line_range(&path, 5, 9).unwrap(), "");
+    }
 }
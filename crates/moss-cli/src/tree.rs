@@ -2,11 +2,13 @@
 //!
 //! Git-aware tree display using the `ignore` crate for gitignore support.
 
+use crate::paths::walk_entry_is_dir;
 use crate::skeleton::{SkeletonExtractor, SkeletonSymbol};
 use ignore::WalkBuilder;
 use moss_languages::support_for_path;
 use serde::Serialize;
 use std::collections::{BTreeMap, HashSet};
+use std::fmt::Write;
 use std::path::Path;
 
 /// Unified node for viewing directories, files, and symbols.
@@ -93,11 +95,8 @@ pub fn format_view_node(node: &ViewNode, options: &FormatOptions) -> Vec<String>
 
         // Add docstring if requested
         if options.docstrings {
-            if let Some(doc) = &node.docstring {
-                let first_line = doc.lines().next().unwrap_or("").trim();
-                if !first_line.is_empty() && !is_useless_docstring(&node.name, first_line) {
-                    lines.push(format!("    \"\"\"{}\"\"\"", first_line));
-                }
+            if let Some(first_line) = doc_summary(node) {
+                lines.push(format!("    \"\"\"{}\"\"\"", first_line));
             }
         }
     }
@@ -111,26 +110,38 @@ pub fn format_view_node(node: &ViewNode, options: &FormatOptions) -> Vec<String>
 
 /// Format a single node line with optional line numbers.
 fn format_node_line(node: &ViewNode, options: &FormatOptions) -> String {
-    let base = match &node.kind {
+    let mut line = String::new();
+    push_node_line(&mut line, node, options);
+    line
+}
+
+/// Append a node line to `out`, so child lines are built in one buffer
+/// after their tree prefix.
+fn push_node_line(out: &mut String, node: &ViewNode, options: &FormatOptions) {
+    match &node.kind {
         ViewNodeKind::Symbol(_) => {
-            if let Some(sig) = &node.signature {
-                format!("{}:", sig)
-            } else {
-                format!("{}:", node.name)
-            }
+            out.push_str(node.signature.as_deref().unwrap_or(&node.name));
+            out.push(':');
         }
-        _ => node.name.clone(),
-    };
+        _ => out.push_str(&node.name),
+    }
 
     // Add line info for symbols if requested
     if options.line_numbers {
         if let Some((start, end)) = node.line_range {
             let size = end.saturating_sub(start) + 1;
-            return format!("{} L{}-{} ({} lines)", base, start, end, size);
+            write!(out, " L{}-{} ({} lines)", start, end, size).unwrap();
         }
     }
+}
 
-    base
+/// First docstring line worth showing for a node, if any.
+fn doc_summary(node: &ViewNode) -> Option<&str> {
+    let first_line = node.docstring.as_deref()?.lines().next()?.trim();
+    if first_line.is_empty() || is_useless_docstring(&node.name, first_line) {
+        return None;
+    }
+    Some(first_line)
 }
 
 /// Check if a docstring is useless (just repeats the name).
@@ -139,13 +150,24 @@ fn is_useless_docstring(name: &str, doc_line: &str) -> bool {
     let name_lower = name.to_lowercase();
 
     // Docstring is just the name, optionally with "function" or "class" etc.
-    if doc_lower == name_lower
-        || doc_lower == format!("{} function", name_lower)
-        || doc_lower == format!("{} method", name_lower)
-        || doc_lower == format!("{} class", name_lower)
-        || doc_lower == format!("the {} function", name_lower)
-        || doc_lower == format!("the {} method", name_lower)
-        || doc_lower == format!("a {} function", name_lower)
+    // Matched by stripping affixes rather than formatting each candidate
+    if let Some(rest) = doc_lower.strip_prefix(name_lower.as_str()) {
+        if matches!(rest, "" | " function" | " method" | " class") {
+            return true;
+        }
+    }
+    if let Some(rest) = doc_lower
+        .strip_prefix("the ")
+        .and_then(|d| d.strip_prefix(name_lower.as_str()))
+    {
+        if matches!(rest, " function" | " method") {
+            return true;
+        }
+    }
+    if doc_lower
+        .strip_prefix("a ")
+        .and_then(|d| d.strip_prefix(name_lower.as_str()))
+        == Some(" function")
     {
         return true;
     }
@@ -175,16 +197,14 @@ fn format_children(
         let child_prefix = format!("{}{}", prefix, if is_last { "    " } else { "│   " });
 
         // Format child line using shared formatter
-        let child_line = format_node_line(child, options);
-        lines.push(format!("{}{}{}", prefix, connector, child_line));
+        let mut child_line = format!("{}{}", prefix, connector);
+        push_node_line(&mut child_line, child, options);
+        lines.push(child_line);
 
         // Add docstring if requested (for symbols)
         if options.docstrings {
-            if let Some(doc) = &child.docstring {
-                let first_line = doc.lines().next().unwrap_or("").trim();
-                if !first_line.is_empty() && !is_useless_docstring(&child.name, first_line) {
-                    lines.push(format!("{}    \"\"\"{}\"\"\"", child_prefix, first_line));
-                }
+            if let Some(first_line) = doc_summary(child) {
+                lines.push(format!("{}    \"\"\"{}\"\"\"", child_prefix, first_line));
             }
         }
 
@@ -311,7 +331,7 @@ pub fn generate_view_tree(root: &Path, options: &TreeOptions) -> ViewNode {
                 continue;
             }
 
-            let is_dir = path.is_dir();
+            let is_dir = walk_entry_is_dir(&entry);
             let parts: Vec<&str> = rel_str.split('/').filter(|s| !s.is_empty()).collect();
             if !parts.is_empty() {
                 tree.add_path(
@@ -529,4 +549,21 @@ mod tests {
         // Should return a ViewNode structure
         assert_eq!(result.kind, ViewNodeKind::Directory);
     }
+
+    #[test]
+    fn test_is_useless_docstring() {
+        assert!(is_useless_docstring("parse", "Parse"));
+        assert!(is_useless_docstring("parse", "parse function"));
+        assert!(is_useless_docstring("Parser", "The parser method"));
+        assert!(is_useless_docstring("parse", "A parse function"));
+        assert!(is_useless_docstring("parse", "Parse it."));
+        assert!(!is_useless_docstring(
+            "parse",
+            "Read tokens into a syntax tree."
+        ));
+        assert!(!is_useless_docstring(
+            "parse",
+            "A parse method that never fails badly"
+        ));
+    }
 }
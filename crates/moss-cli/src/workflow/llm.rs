@@ -113,6 +113,8 @@ impl Provider {
 pub struct LlmClient {
     provider: Provider,
     model: String,
+    /// Reused across turns so each completion doesn't spin up a new runtime.
+    runtime: tokio::runtime::Runtime,
 }
 
 #[cfg(feature = "llm")]
@@ -144,14 +146,19 @@ impl LlmClient {
             .map(|m| m.to_string())
             .unwrap_or_else(|| provider.default_model().to_string());
 
-        Ok(Self { provider, model })
+        let runtime = tokio::runtime::Runtime::new()
+            .map_err(|e| format!("Failed to create runtime: {}", e))?;
+
+        Ok(Self {
+            provider,
+            model,
+            runtime,
+        })
     }
 
     /// Generate a completion.
     pub fn complete(&self, system: Option<&str>, prompt: &str) -> Result<String, String> {
-        let rt = tokio::runtime::Runtime::new()
-            .map_err(|e| format!("Failed to create runtime: {}", e))?;
-        rt.block_on(self.complete_async(system, prompt))
+        self.runtime.block_on(self.complete_async(system, prompt))
     }
 
     async fn complete_async(&self, system: Option<&str>, prompt: &str) -> Result<String, String> {
@@ -213,11 +220,11 @@ pub fn parse_agent_response(response: &str) -> AgentAction {
 
         // Check for command (lines starting with "> ")
         if let Some(cmd) = line.strip_prefix("> ") {
-            let parts: Vec<&str> = cmd.split_whitespace().collect();
-            if let Some((name, args)) = parts.split_first() {
+            let mut parts = cmd.split_whitespace();
+            if let Some(name) = parts.next() {
                 return AgentAction::Command {
                     name: name.to_string(),
-                    args: args.iter().map(|s| s.to_string()).collect(),
+                    args: parts.map(String::from).collect(),
                 };
             }
         }
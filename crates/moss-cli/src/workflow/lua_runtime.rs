@@ -368,7 +368,7 @@ impl LuaRuntime {
                     .map_err(mlua::Error::external)?;
 
                 Ok(CommandResult {
-                    output: String::from_utf8_lossy(&output.stdout).to_string(),
+                    output: stdout_to_string(output.stdout),
                     success: output.status.success(),
                 })
             })?,
@@ -618,7 +618,7 @@ fn run_subprocess_in_dir(args: &[String], dir: &Path) -> LuaResult<CommandResult
         .map_err(mlua::Error::external)?;
 
     Ok(CommandResult {
-        output: String::from_utf8_lossy(&output.stdout).to_string(),
+        output: stdout_to_string(output.stdout),
         success: output.status.success(),
     })
 }
@@ -632,11 +632,16 @@ fn run_subprocess(args: &[String]) -> LuaResult<CommandResult> {
         .map_err(mlua::Error::external)?;
 
     Ok(CommandResult {
-        output: String::from_utf8_lossy(&output.stdout).to_string(),
+        output: stdout_to_string(output.stdout),
         success: output.status.success(),
     })
 }
 
+/// Take ownership of captured stdout, only copying it if it isn't valid UTF-8.
+fn stdout_to_string(stdout: Vec<u8>) -> String {
+    String::from_utf8(stdout).unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -37,6 +37,32 @@ pub struct CrossRef {
     pub line: usize,
 }
 
+/// A build file handed to each binding, with Cargo manifests parsed once up front.
+pub struct BuildFile<'a> {
+    /// Path to the build file (e.g., "crates/foo/Cargo.toml")
+    pub path: &'a Path,
+    /// Raw file contents
+    pub content: &'a str,
+    /// Parsed manifest, if this is a Cargo.toml that parses as TOML
+    pub cargo_manifest: Option<toml::Table>,
+}
+
+impl<'a> BuildFile<'a> {
+    /// Wrap a build file, parsing it only if it is a Cargo.toml.
+    pub fn new(path: &'a Path, content: &'a str) -> Self {
+        let cargo_manifest = if path.file_name().is_some_and(|n| n == "Cargo.toml") {
+            content.parse::<toml::Table>().ok()
+        } else {
+            None
+        };
+        Self {
+            path,
+            content,
+            cargo_manifest,
+        }
+    }
+}
+
 /// Trait for FFI binding detection.
 ///
 /// Each binding type (PyO3, wasm-bindgen, etc.) implements this trait
@@ -53,7 +79,7 @@ pub trait FfiBinding: Send + Sync {
 
     /// Check if a build file (e.g., Cargo.toml) indicates this binding is used.
     /// Returns the module name if detected.
-    fn detect_in_build_file(&self, path: &Path, content: &str) -> Option<String>;
+    fn detect_in_build_file(&self, build_file: &BuildFile) -> Option<String>;
 
     /// File extensions that may contain imports of this binding's modules.
     fn consumer_extensions(&self) -> &[&'static str];
@@ -83,14 +109,12 @@ impl FfiBinding for PyO3Binding {
         "python"
     }
 
-    fn detect_in_build_file(&self, path: &Path, content: &str) -> Option<String> {
-        if path.file_name()? != "Cargo.toml" {
-            return None;
-        }
-        if !content.contains("pyo3") && !content.contains("PyO3") {
+    fn detect_in_build_file(&self, build_file: &BuildFile) -> Option<String> {
+        let manifest = build_file.cargo_manifest.as_ref()?;
+        if !cargo_has_dependency(manifest, &["pyo3"]) {
             return None;
         }
-        extract_cargo_crate_name(content)
+        cargo_package_name(manifest)
     }
 
     fn consumer_extensions(&self) -> &[&'static str] {
@@ -122,14 +146,12 @@ impl FfiBinding for WasmBindgenBinding {
         "javascript"
     }
 
-    fn detect_in_build_file(&self, path: &Path, content: &str) -> Option<String> {
-        if path.file_name()? != "Cargo.toml" {
+    fn detect_in_build_file(&self, build_file: &BuildFile) -> Option<String> {
+        let manifest = build_file.cargo_manifest.as_ref()?;
+        if !cargo_has_dependency(manifest, &["wasm-bindgen"]) {
             return None;
         }
-        if !content.contains("wasm-bindgen") {
-            return None;
-        }
-        extract_cargo_crate_name(content)
+        cargo_package_name(manifest)
     }
 
     fn consumer_extensions(&self) -> &[&'static str] {
@@ -161,14 +183,12 @@ impl FfiBinding for NapiRsBinding {
         "javascript"
     }
 
-    fn detect_in_build_file(&self, path: &Path, content: &str) -> Option<String> {
-        if path.file_name()? != "Cargo.toml" {
+    fn detect_in_build_file(&self, build_file: &BuildFile) -> Option<String> {
+        let manifest = build_file.cargo_manifest.as_ref()?;
+        if !cargo_has_dependency(manifest, &["napi", "napi-derive"]) {
             return None;
         }
-        if !content.contains("napi") {
-            return None;
-        }
-        extract_cargo_crate_name(content)
+        cargo_package_name(manifest)
     }
 
     fn consumer_extensions(&self) -> &[&'static str] {
@@ -199,19 +219,16 @@ impl FfiBinding for CdylibBinding {
         "c"
     }
 
-    fn detect_in_build_file(&self, path: &Path, content: &str) -> Option<String> {
-        if path.file_name()? != "Cargo.toml" {
-            return None;
-        }
+    fn detect_in_build_file(&self, build_file: &BuildFile) -> Option<String> {
+        let manifest = build_file.cargo_manifest.as_ref()?;
         // Only match cdylib that isn't already caught by pyo3/wasm-bindgen/napi
-        if !content.contains("cdylib") {
+        if !cargo_is_cdylib(manifest) {
             return None;
         }
-        if content.contains("pyo3") || content.contains("wasm-bindgen") || content.contains("napi")
-        {
+        if cargo_has_dependency(manifest, &["pyo3", "wasm-bindgen", "napi", "napi-derive"]) {
             return None;
         }
-        extract_cargo_crate_name(content)
+        cargo_package_name(manifest)
     }
 
     fn consumer_extensions(&self) -> &[&'static str] {
@@ -245,7 +262,7 @@ impl FfiBinding for CtypesBinding {
         "c"
     }
 
-    fn detect_in_build_file(&self, _path: &Path, _content: &str) -> Option<String> {
+    fn detect_in_build_file(&self, _build_file: &BuildFile) -> Option<String> {
         // ctypes doesn't have a build file indicator
         None
     }
@@ -275,7 +292,7 @@ impl FfiBinding for CffiBinding {
         "c"
     }
 
-    fn detect_in_build_file(&self, _path: &Path, _content: &str) -> Option<String> {
+    fn detect_in_build_file(&self, _build_file: &BuildFile) -> Option<String> {
         None
     }
 
@@ -333,9 +350,10 @@ impl FfiDetector {
         let mut modules = Vec::new();
         let parent = path.parent().unwrap_or(Path::new(""));
         let lib_path = parent.join("src").join("lib.rs");
+        let build_file = BuildFile::new(path, content);
 
         for binding in &self.bindings {
-            if let Some(name) = binding.detect_in_build_file(path, content) {
+            if let Some(name) = binding.detect_in_build_file(&build_file) {
                 modules.push(FfiModule {
                     name,
                     lib_path: lib_path.to_string_lossy().to_string(),
@@ -383,28 +401,34 @@ impl FfiDetector {
 // Helpers
 // ============================================================================
 
-/// Extract crate name from Cargo.toml content.
-fn extract_cargo_crate_name(content: &str) -> Option<String> {
-    let mut in_package = false;
-    for line in content.lines() {
-        let trimmed = line.trim();
-        if trimmed == "[package]" {
-            in_package = true;
-            continue;
-        }
-        if trimmed.starts_with('[') {
-            in_package = false;
-            continue;
-        }
-        if in_package && trimmed.starts_with("name") {
-            if let Some(eq_pos) = trimmed.find('=') {
-                let value = trimmed[eq_pos + 1..].trim();
-                let value = value.trim_matches('"').trim_matches('\'');
-                return Some(value.to_string());
-            }
-        }
-    }
-    None
+/// Package name from a parsed Cargo.toml (`name` under `[package]`).
+fn cargo_package_name(manifest: &toml::Table) -> Option<String> {
+    let name = manifest.get("package")?.get("name")?.as_str()?;
+    Some(name.to_string())
+}
+
+/// Check whether a Cargo.toml depends on any of `names` in `[dependencies]`,
+/// `[build-dependencies]` or their `[target.'...']` variants.
+fn cargo_has_dependency(manifest: &toml::Table, names: &[&str]) -> bool {
+    let has_dep = |table: &toml::Table| {
+        ["dependencies", "build-dependencies"]
+            .iter()
+            .filter_map(|key| table.get(*key)?.as_table())
+            .any(|deps| names.iter().any(|name| deps.contains_key(*name)))
+    };
+    has_dep(manifest)
+        || manifest
+            .get("target")
+            .and_then(|t| t.as_table())
+            .is_some_and(|targets| targets.values().filter_map(|t| t.as_table()).any(has_dep))
+}
+
+/// Check whether a Cargo.toml builds a `cdylib` (`crate-type` under `[lib]`).
+fn cargo_is_cdylib(manifest: &toml::Table) -> bool {
+    manifest
+        .get("lib")
+        .and_then(|lib| lib.get("crate-type")?.as_array())
+        .is_some_and(|types| types.iter().any(|t| t.as_str() == Some("cdylib")))
 }
 
 #[cfg(test)]
@@ -422,10 +446,52 @@ version = "0.1.0"
 [dependencies]
 pyo3 = "0.20"
 "#;
-        let result = binding.detect_in_build_file(Path::new("Cargo.toml"), content);
+        let build_file = BuildFile::new(Path::new("Cargo.toml"), content);
+        let result = binding.detect_in_build_file(&build_file);
         assert_eq!(result, Some("my-lib".to_string()));
     }
 
+    #[test]
+    fn test_cargo_dependency_detection() {
+        let content = r#"
+[package]
+name = "plain"
+description = "Not a pyo3 crate, unlike napi users"
+
+[lib ] # built for FFI
+crate-type = [
+    "cdylib",
+]
+
+# pyo3 = "0.20"
+[dependencies]
+serde = "1"
+tokio = { version = "1", features = [
+    "pyo3",
+] }
+
+[workspace.dependencies]
+pyo3 = "0.20"
+
+[target.'cfg(unix)'.dependencies.napi-derive]
+version = "2"
+"#;
+        let manifest: toml::Table = content.parse().unwrap();
+        assert!(!cargo_has_dependency(&manifest, &["pyo3"]));
+        assert!(cargo_has_dependency(&manifest, &["napi", "napi-derive"]));
+        assert!(cargo_has_dependency(&manifest, &["serde"]));
+        assert!(cargo_is_cdylib(&manifest));
+        assert_eq!(cargo_package_name(&manifest), Some("plain".to_string()));
+
+        let rlib: toml::Table = "[lib]\ncrate-type = [\"rlib\"]\n".parse().unwrap();
+        assert!(!cargo_is_cdylib(&rlib));
+
+        // Only Cargo.toml files are parsed
+        assert!(BuildFile::new(Path::new("pyproject.toml"), content)
+            .cargo_manifest
+            .is_none());
+    }
+
     #[test]
     fn test_pyo3_import_matching() {
         let binding = PyO3Binding;
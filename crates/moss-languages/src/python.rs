@@ -15,19 +15,23 @@ static PYTHON_CACHE: Mutex<Option<PythonPathCache>> = Mutex::new(None);
 /// Cached Python paths detected from filesystem structure.
 #[derive(Clone)]
 struct PythonPathCache {
+    /// Project root as last requested, checked before canonicalizing
+    requested: PathBuf,
     /// Canonical project root used as cache key
     root: PathBuf,
     /// Python version (e.g., "3.13")
     version: Option<String>,
     /// Stdlib path (e.g., /usr/.../lib/python3.13/)
     stdlib: Option<PathBuf>,
-    /// Site-packages path
+    /// Site-packages path, falling back to the nearest ancestor venv
     site_packages: Option<PathBuf>,
 }
 
 impl PythonPathCache {
-    fn new(root: &Path) -> Self {
-        let root = root.canonicalize().unwrap_or_else(|_| root.to_path_buf());
+    fn new(project_root: &Path) -> Self {
+        let root = project_root
+            .canonicalize()
+            .unwrap_or_else(|_| project_root.to_path_buf());
 
         // Try to find Python from venv or PATH
         let python_bin = if root.join(".venv/bin/python").exists() {
@@ -53,10 +57,11 @@ impl PythonPathCache {
 
         let Some(python_bin) = python_bin else {
             return Self {
+                requested: project_root.to_path_buf(),
                 root,
                 version: None,
                 stdlib: None,
-                site_packages: None,
+                site_packages: find_ancestor_venv_site_packages(project_root),
             };
         };
 
@@ -139,24 +144,34 @@ impl PythonPathCache {
         };
 
         Self {
+            requested: project_root.to_path_buf(),
             root,
             version,
             stdlib,
-            site_packages,
+            site_packages: site_packages.or_else(|| find_ancestor_venv_site_packages(project_root)),
         }
     }
 }
 
 /// Get cached Python paths for a project.
 fn get_python_cache(project_root: &Path) -> PythonPathCache {
+    let mut cache_guard = PYTHON_CACHE.lock().unwrap();
+
+    // Every import resolution lands here; skip the canonicalize syscalls
+    // when the root is the same absolute path as last time
+    if let Some(ref cache) = *cache_guard {
+        if project_root.is_absolute() && cache.requested == project_root {
+            return cache.clone();
+        }
+    }
+
     let canonical = project_root
         .canonicalize()
         .unwrap_or_else(|_| project_root.to_path_buf());
 
-    let mut cache_guard = PYTHON_CACHE.lock().unwrap();
-
-    if let Some(ref cache) = *cache_guard {
+    if let Some(ref mut cache) = *cache_guard {
         if cache.root == canonical {
+            cache.requested = project_root.to_path_buf();
             return cache.clone();
         }
     }
@@ -266,24 +281,21 @@ fn resolve_python_stdlib_import(import_name: &str, stdlib_path: &Path) -> Option
 /// 1. .venv/lib/pythonX.Y/site-packages/ (uv, poetry, standard venv)
 /// 2. Walk up looking for venv directories
 pub fn find_python_site_packages(project_root: &Path) -> Option<PathBuf> {
-    // Use cached result from filesystem detection
-    if let Some(site) = get_python_cache(project_root).site_packages {
-        return Some(site);
-    }
+    // Cached, including the parent directory scan, since every external
+    // import resolution asks for it
+    get_python_cache(project_root).site_packages
+}
 
-    // Fall back to scanning parent directories for venvs
-    let mut current = project_root.to_path_buf();
-    while let Some(parent) = current.parent() {
+/// Scan parent directories for a venv and return its site-packages.
+fn find_ancestor_venv_site_packages(project_root: &Path) -> Option<PathBuf> {
+    project_root.ancestors().skip(1).find_map(|parent| {
         let venv_dir = parent.join(".venv");
         if venv_dir.is_dir() {
-            if let Some(site_packages) = find_site_packages_in_venv(&venv_dir) {
-                return Some(site_packages);
-            }
+            find_site_packages_in_venv(&venv_dir)
+        } else {
+            None
         }
-        current = parent.to_path_buf();
-    }
-
-    None
+    })
 }
 
 /// Find site-packages within a venv directory.
@@ -654,21 +666,17 @@ impl Language for Python {
             }
             "import_from_statement" => {
                 // from foo import bar, baz
-                let module = node
-                    .child_by_field_name("module_name")
+                let module_node = node.child_by_field_name("module_name");
+                let module = module_node
                     .map(|m| content[m.byte_range()].to_string())
                     .unwrap_or_default();
 
-                // Check for relative import (from . or from .. or from .foo)
-                let text = &content[node.byte_range()];
-                let is_relative = text.starts_with("from .");
+                // Relative imports (from . or from .. or from .foo) parse as relative_import
+                let is_relative = module_node.is_some_and(|m| m.kind() == "relative_import");
 
                 let mut names = Vec::new();
                 let mut is_wildcard = false;
-                let module_end = node
-                    .child_by_field_name("module_name")
-                    .map(|m| m.end_byte())
-                    .unwrap_or(0);
+                let module_end = module_node.map(|m| m.end_byte()).unwrap_or(0);
 
                 let mut cursor = node.walk();
                 for child in node.children(&mut cursor) {
@@ -804,10 +812,7 @@ impl Language for Python {
             let module_part = &import_name[dots..];
 
             // Go up (dots-1) directories from current file's directory
-            let mut base = current_dir.to_path_buf();
-            for _ in 1..dots {
-                base = base.parent()?.to_path_buf();
-            }
+            let base = current_dir.ancestors().nth(dots - 1)?;
 
             // Convert module.path to module/path.py
             let module_path = if module_part.is_empty() {
@@ -1073,6 +1078,22 @@ mod tests {
         assert_eq!(sym.docstring, Some("A foo class.".to_string()));
     }
 
+    #[test]
+    fn test_python_relative_imports() {
+        let support = Python;
+        let content = "from . import a\nfrom ..pkg import b\nfrom pkg import c\n";
+        let tree = parse_python(content);
+        let root = tree.root_node();
+
+        let mut cursor = root.walk();
+        let relative: Vec<bool> = root
+            .children(&mut cursor)
+            .flat_map(|n| support.extract_imports(&n, content))
+            .map(|imp| imp.is_relative)
+            .collect();
+        assert_eq!(relative, vec![true, true, false]);
+    }
+
     #[test]
     fn test_python_visibility() {
         let support = Python;
@@ -350,10 +350,16 @@ fn grammar_map() -> &'static HashMap<&'static str, &'static dyn Language> {
 ///
 /// Returns `None` if the extension is not recognized or the feature is not enabled.
 pub fn support_for_extension(ext: &str) -> Option<&'static dyn Language> {
-    extension_map()
-        .get(ext)
-        .or_else(|| extension_map().get(ext.to_lowercase().as_str()))
-        .copied()
+    let map = extension_map();
+    if let Some(lang) = map.get(ext) {
+        return Some(*lang);
+    }
+    // Most misses are unsupported lowercase extensions; only allocate a
+    // lowercased copy when there may be something to fold
+    if ext.is_ascii() && !ext.bytes().any(|b| b.is_ascii_uppercase()) {
+        return None;
+    }
+    map.get(ext.to_lowercase().as_str()).copied()
 }
 
 /// Get language support by grammar name.
@@ -119,9 +119,19 @@ pub fn skip_dotfiles(name: &str) -> bool {
 
 /// Check if name has one of the given extensions
 pub fn has_extension(name: &str, extensions: &[&str]) -> bool {
-    extensions
-        .iter()
-        .any(|ext| name.ends_with(&format!(".{}", ext)))
+    extensions.iter().any(|ext| {
+        name.strip_suffix(ext)
+            .is_some_and(|stem| stem.ends_with('.'))
+    })
+}
+
+/// Check if a directory entry is a directory, following symlinks.
+/// Uses the file type from the directory listing, so only symlinks need a stat.
+fn entry_is_dir(entry: &std::fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(file_type) if !file_type.is_symlink() => file_type.is_dir(),
+        _ => entry.path().is_dir(),
+    }
 }
 
 /// Unified language support trait.
@@ -324,7 +334,7 @@ pub trait Language: Send + Sync {
             let path = entry.path();
             let name = entry.file_name().to_string_lossy().to_string();
 
-            if self.should_skip_package_entry(&name, path.is_dir()) {
+            if self.should_skip_package_entry(&name, entry_is_dir(&entry)) {
                 continue;
             }
 
@@ -349,7 +359,7 @@ pub trait Language: Send + Sync {
         for entry in entries.flatten() {
             let path = entry.path();
             let name = entry.file_name().to_string_lossy().to_string();
-            let is_dir = path.is_dir();
+            let is_dir = entry_is_dir(&entry);
 
             if self.should_skip_package_entry(&name, is_dir) {
                 continue;
@@ -385,18 +395,20 @@ pub trait Language: Send + Sync {
         for entry in entries.flatten() {
             let path = entry.path();
             let name = entry.file_name().to_string_lossy().to_string();
+            let is_dir = entry_is_dir(&entry);
 
-            if self.should_skip_package_entry(&name, path.is_dir()) {
+            if self.should_skip_package_entry(&name, is_dir) {
                 continue;
             }
 
-            if name.starts_with('@') && path.is_dir() {
+            if name.starts_with('@') && is_dir {
                 // Scoped package - iterate contents
                 if let Ok(scoped_entries) = std::fs::read_dir(&path) {
                     for scoped_entry in scoped_entries.flatten() {
                         let scoped_path = scoped_entry.path();
                         let scoped_name = scoped_entry.file_name().to_string_lossy().to_string();
-                        if self.should_skip_package_entry(&scoped_name, scoped_path.is_dir()) {
+                        let scoped_is_dir = entry_is_dir(&scoped_entry);
+                        if self.should_skip_package_entry(&scoped_name, scoped_is_dir) {
                             continue;
                         }
                         let full_name = format!("{}/{}", name, scoped_name);
@@ -154,23 +154,24 @@ impl Ecosystem for Cargo {
         // Build tree structure
         let mut visited = std::collections::HashSet::new();
 
-        fn build_node(
-            name: &str,
-            packages: &std::collections::HashMap<String, (String, Vec<String>)>,
-            visited: &mut std::collections::HashSet<String>,
+        // Names are borrowed from the lockfile data; dependency lists are
+        // walked in place rather than cloned per node
+        fn build_node<'a>(
+            name: &'a str,
+            packages: &'a std::collections::HashMap<String, (String, Vec<String>)>,
+            visited: &mut std::collections::HashSet<&'a str>,
         ) -> TreeNode {
-            let (version, deps) = packages
-                .get(name)
-                .map(|(v, d)| (v.clone(), d.clone()))
-                .unwrap_or_default();
+            let (version, deps) = match packages.get(name) {
+                Some((v, d)) => (v.clone(), d.as_slice()),
+                None => (String::new(), &[][..]),
+            };
 
-            let children = if visited.contains(name) {
-                Vec::new() // Already visited, don't recurse
-            } else {
-                visited.insert(name.to_string());
+            let children = if visited.insert(name) {
                 deps.iter()
                     .map(|dep| build_node(dep, packages, visited))
                     .collect()
+            } else {
+                Vec::new() // Already visited, don't recurse
             };
 
             TreeNode {
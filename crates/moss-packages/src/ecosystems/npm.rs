@@ -325,17 +325,17 @@ fn build_npm_tree(parsed: &serde_json::Value) -> Result<DependencyTree, crate::P
                 .push((pkg_name.to_string(), pkg_version.to_string()));
         }
 
-        fn build_node(
-            name: &str,
+        fn build_node<'a>(
+            name: &'a str,
             version: &str,
             parent_path: &str,
-            deps_map: &std::collections::HashMap<String, Vec<(String, String)>>,
-            visited: &mut std::collections::HashSet<String>,
+            deps_map: &'a std::collections::HashMap<String, Vec<(String, String)>>,
+            visited: &mut std::collections::HashSet<&'a str>,
         ) -> TreeNode {
-            let children = if visited.contains(name) {
+            // Names are borrowed from deps_map, so marking one visited is free
+            let children = if !visited.insert(name) {
                 Vec::new()
             } else {
-                visited.insert(name.to_string());
                 let child_path = if parent_path.is_empty() {
                     name.to_string()
                 } else {
@@ -361,18 +361,18 @@ fn build_python_tree(
         }
     }
 
-    fn build_node(
+    fn build_node<'a>(
         name: &str,
-        packages: &std::collections::HashMap<String, (String, Vec<String>)>,
-        visited: &mut std::collections::HashSet<String>,
+        packages: &'a std::collections::HashMap<String, (String, Vec<String>)>,
+        visited: &mut std::collections::HashSet<&'a str>,
     ) -> Option<TreeNode> {
         let normalized = name.to_lowercase().replace(['-', '.'], "_");
-        let (version, deps) = packages.get(&normalized)?;
+        // Track the map's own key so marking a package visited doesn't allocate
+        let (key, (version, deps)) = packages.get_key_value(&normalized)?;
 
-        let children = if visited.contains(&normalized) {
+        let children = if !visited.insert(key) {
             Vec::new()
         } else {
-            visited.insert(normalized);
             deps.iter()
                 .filter_map(|dep| build_node(dep, packages, visited))
                 .collect()
@@ -393,7 +393,7 @@ fn build_python_tree(
         for pkg in pkgs {
             let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
             let normalized = name.to_lowercase().replace(['-', '.'], "_");
-            if !visited.contains(&normalized) {
+            if !visited.contains(normalized.as_str()) {
                 if let Some(node) = build_node(name, &packages, &mut visited) {
                     root_deps.push(node);
                 }
@@ -22,8 +22,21 @@ use crate::{
 };
 use serde::Deserialize;
 use std::collections::HashMap;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::Mutex;
+use std::time::SystemTime;
+
+/// Last parsed `tools.toml`, reused while the file is unchanged.
+/// `moss lint --watch` rebuilds the tool registry on every run.
+static CONFIG_CACHE: Mutex<Option<CachedToolsConfig>> = Mutex::new(None);
+
+struct CachedToolsConfig {
+    path: PathBuf,
+    modified: SystemTime,
+    len: u64,
+    config: ToolsConfig,
+}
 
 /// Configuration for custom tools.
 #[derive(Debug, Clone, Deserialize)]
@@ -293,26 +306,50 @@ fn run_custom_command(
 pub fn load_custom_tools(root: &Path) -> Vec<Box<dyn Tool>> {
     let config_path = root.join(".moss").join("tools.toml");
 
-    if !config_path.exists() {
+    let Some(config) = load_tools_config(&config_path) else {
         return Vec::new();
+    };
+
+    config
+        .tools
+        .into_iter()
+        .map(|(name, tool_config)| Box::new(CustomTool::new(name, tool_config)) as Box<dyn Tool>)
+        .collect()
+}
+
+/// Parse `tools.toml`, reusing the cached parse if mtime and size match.
+fn load_tools_config(config_path: &Path) -> Option<ToolsConfig> {
+    let meta = std::fs::metadata(config_path).ok()?;
+    let modified = meta.modified().ok();
+
+    if let Some(modified) = modified {
+        let cache = CONFIG_CACHE.lock().unwrap();
+        if let Some(cached) = cache.as_ref() {
+            if cached.path == config_path && cached.modified == modified && cached.len == meta.len()
+            {
+                return Some(cached.config.clone());
+            }
+        }
     }
 
-    let content = match std::fs::read_to_string(&config_path) {
-        Ok(c) => c,
-        Err(_) => return Vec::new(),
-    };
+    let content = std::fs::read_to_string(config_path).ok()?;
 
     let config: ToolsConfig = match toml::from_str(&content) {
         Ok(c) => c,
         Err(e) => {
             eprintln!("Warning: failed to parse {}: {}", config_path.display(), e);
-            return Vec::new();
+            return None;
         }
     };
 
-    config
-        .tools
-        .into_iter()
-        .map(|(name, tool_config)| Box::new(CustomTool::new(name, tool_config)) as Box<dyn Tool>)
-        .collect()
+    if let Some(modified) = modified {
+        *CONFIG_CACHE.lock().unwrap() = Some(CachedToolsConfig {
+            path: config_path.to_path_buf(),
+            modified,
+            len: meta.len(),
+            config: config.clone(),
+        });
+    }
+
+    Some(config)
 }